@@ -4,7 +4,7 @@ This package retrieves CBSE textbook chunks from Qdrant vector database
 based on blueprint specifications for question generation.
 """
 
-from .tool import generate_question_tool
+from .tool import generate_question_tool, generate_section_questions_tool
 from .llm_question_generator import generate_llm_question_tool
 from .data_types import (
     Chunk,
@@ -15,6 +15,7 @@ from .data_types import (
 
 __all__ = [
     "generate_question_tool",  # Retrieval tool
+    "generate_section_questions_tool",  # Section retrieval tool
     "generate_llm_question_tool",  # LLM generation tool
     "Chunk",
     "RetrievedData",
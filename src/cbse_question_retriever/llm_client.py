@@ -26,6 +26,7 @@ class LLMClient:
         self._temperature = settings.llm.temperature
         self._max_tokens = settings.llm.max_tokens
         self._timeout = settings.llm.timeout
+        self._base_url = settings.llm.base_url
 
     @property
     def llm(self) -> ChatOpenAI:
@@ -36,14 +37,20 @@ class LLMClient:
                     "OpenAI API key not set. Please set OPENAI__API_KEY in environment."
                 )
 
+            # Only override the endpoint when configured, so OPENAI_BASE_URL still applies
+            endpoint = {"base_url": self._base_url} if self._base_url else {}
             self._llm = ChatOpenAI(
                 model=self._model,
                 temperature=self._temperature,
                 max_tokens=self._max_tokens,
                 timeout=self._timeout,
                 api_key=settings.openai.api_key,
+                **endpoint,
+            )
+            logger.info(
+                f"Initialized LangChain ChatOpenAI with model: {self._model}"
+                + (f" at {self._base_url}" if self._base_url else "")
             )
-            logger.info(f"Initialized LangChain ChatOpenAI with model: {self._model}")
 
         return self._llm
 
@@ -59,6 +59,7 @@ def generate_llm_question_tool(
         - explanation: Step-by-step solution for teacher verification
         - diagram_needed: Boolean indicating diagram requirement
         - diagram_description: Detailed description if diagram needed
+        - diagram_type: Diagram type from LLM detection (geometric/coordinate/...)
         - generation_metadata: Technical details
         - error: Error message if generation failed, else None
 
@@ -164,6 +165,7 @@ def generate_llm_question_tool(
         # Update question data with diagram info
         question_data["diagram_needed"] = diagram_info["diagram_needed"]
         question_data["diagram_description"] = diagram_info["diagram_description"]
+        question_data["diagram_type"] = diagram_info["diagram_type"]
 
         logger.info(
             f"Diagram detection: needed={diagram_info['diagram_needed']}, "
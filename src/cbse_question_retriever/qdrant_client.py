@@ -1,11 +1,22 @@
 """Qdrant client wrapper for CBSE Question Retriever."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from qdrant_client import QdrantClient
 from qdrant_client.http.exceptions import UnexpectedResponse
-from qdrant_client.http.models import Distance, VectorParams
+from qdrant_client.http.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
 
 from .settings import settings
 from .data_types import Chunk, ChunkType
@@ -54,6 +65,32 @@ class QdrantManager:
             logger.error(f"Error checking collection existence: {e}")
             return False
 
+    def create_collection(self, collection_name: str) -> None:
+        """Create a chunk collection with int8 scalar quantization.
+
+        Original float vectors are kept on disk for rescoring while the int8 copy
+        (4x smaller) stays in RAM and serves the search itself.
+
+        Args:
+            collection_name: Name of the collection to create
+        """
+        try:
+            self.client.create_collection(
+                collection_name=collection_name,
+                vectors_config=VectorParams(
+                    size=settings.openai.embedding_dimensions,
+                    distance=Distance.COSINE,
+                    on_disk=True,
+                ),
+                quantization_config=ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+                ),
+            )
+            logger.info(f"Created collection '{collection_name}' with int8 quantization")
+        except Exception as e:
+            logger.error(f"Error creating collection '{collection_name}': {e}")
+            raise
+
     def get_available_collections(self) -> List[str]:
         """Get list of all available collections."""
         try:
@@ -82,47 +119,18 @@ class QdrantManager:
             List of Chunk objects
         """
         try:
-            # Build query filter if conditions provided
-            query_filter = None
-            if filter_conditions:
-                from qdrant_client.http.models import FieldCondition, MatchValue, Filter
-
-                must_conditions = []
-                for key, value in filter_conditions.items():
-                    must_conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
-                query_filter = Filter(must=must_conditions)
-
             # Perform vector search (using query_points for newer Qdrant client versions)
-            from qdrant_client.http.models import SearchRequest
-
             results = self.client.query_points(
                 collection_name=collection_name,
                 query=query_vector,
-                query_filter=query_filter,
+                query_filter=self._build_filter(filter_conditions),
+                search_params=self._search_params(),
                 limit=limit,
                 with_payload=True,
                 with_vectors=False,
             ).points
 
-            # Convert to Chunk objects
-            chunks = []
-            for result in results:
-                payload = result.payload
-                chunks.append(
-                    Chunk(
-                        id=str(result.id),
-                        text=payload.get("text", ""),
-                        chapter=payload.get("chapter", ""),
-                        section=payload.get("section", ""),
-                        topic=payload.get("topic", ""),
-                        chunk_type=ChunkType(payload.get("chunk_type", "THEORY")),
-                        page_start=payload.get("page_start", 0),
-                        page_end=payload.get("page_end", 0),
-                        score=result.score,
-                    )
-                )
-
-            return chunks
+            return self._to_chunks(results)
 
         except UnexpectedResponse as e:
             logger.error(f"Qdrant search error: {e}")
@@ -131,6 +139,95 @@ class QdrantManager:
             logger.error(f"Unexpected error during search: {e}")
             raise
 
+    def search_by_vectors_batch(
+        self,
+        collection_name: str,
+        searches: List[Tuple[List[float], Optional[Dict[str, Any]]]],
+        limit: int = 10,
+    ) -> List[List[Chunk]]:
+        """Run several vector searches against one collection in a single request.
+
+        Args:
+            collection_name: Name of the Qdrant collection
+            searches: (query_vector, filter_conditions) pairs, one per search
+            limit: Maximum number of results per search
+
+        Returns:
+            List of Chunk lists, in the same order as searches
+        """
+        if not searches:
+            return []
+
+        try:
+            from qdrant_client.http.models import QueryRequest
+
+            requests = [
+                QueryRequest(
+                    query=query_vector,
+                    filter=self._build_filter(filter_conditions),
+                    params=self._search_params(),
+                    limit=limit,
+                    with_payload=True,
+                    with_vector=False,
+                )
+                for query_vector, filter_conditions in searches
+            ]
+            responses = self.client.query_batch_points(
+                collection_name=collection_name, requests=requests
+            )
+
+            return [self._to_chunks(response.points) for response in responses]
+
+        except UnexpectedResponse as e:
+            logger.error(f"Qdrant batch search error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during batch search: {e}")
+            raise
+
+    def _search_params(self) -> SearchParams:
+        """Search params rescoring quantized hits against the original vectors.
+
+        Ignored by Qdrant for collections created without quantization.
+        """
+        return SearchParams(
+            quantization=QuantizationSearchParams(
+                rescore=settings.retrieval.quantization_rescore,
+                oversampling=settings.retrieval.quantization_oversampling,
+            )
+        )
+
+    def _build_filter(self, filter_conditions: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Build a Qdrant filter matching every key/value in filter_conditions."""
+        if not filter_conditions:
+            return None
+        return Filter(
+            must=[
+                FieldCondition(key=key, match=MatchValue(value=value))
+                for key, value in filter_conditions.items()
+            ]
+        )
+
+    def _to_chunks(self, results: List[Any]) -> List[Chunk]:
+        """Convert scored Qdrant points to Chunk objects."""
+        chunks = []
+        for result in results:
+            payload = result.payload
+            chunks.append(
+                Chunk(
+                    id=str(result.id),
+                    text=payload.get("text", ""),
+                    chapter=payload.get("chapter", ""),
+                    section=payload.get("section", ""),
+                    topic=payload.get("topic", ""),
+                    chunk_type=ChunkType(payload.get("chunk_type", "THEORY")),
+                    page_start=payload.get("page_start", 0),
+                    page_end=payload.get("page_end", 0),
+                    score=result.score,
+                )
+            )
+        return chunks
+
     def get_distinct_topics(self, collection_name: str, chapter: Optional[str] = None) -> List[str]:
         """Get all distinct topics from a collection.
 
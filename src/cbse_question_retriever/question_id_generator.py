@@ -60,7 +60,9 @@ class QuestionIDGenerator:
     def _get_chapter_abbreviation(self, chapter: str) -> str:
         """Get chapter abbreviation."""
         chapter_lower = chapter.lower().strip()
-        return CHAPTER_ABBREVIATIONS.get(chapter_lower, self._generate_abbr(chapter))
+        # Only build the fallback abbreviation for chapters missing from the table
+        abbr = CHAPTER_ABBREVIATIONS.get(chapter_lower)
+        return abbr if abbr is not None else self._generate_abbr(chapter)
 
     def _get_format_abbreviation(self, question_format: str) -> str:
         """Get format abbreviation."""
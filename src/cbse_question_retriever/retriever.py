@@ -5,17 +5,17 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple
 
 from .chunk_mixer import chunk_mixer
-from .embedder import embedding_generator
-from .fuzzy_matcher import fuzzy_matcher
-from .qdrant_client import qdrant_manager
-from .question_id_generator import question_id_generator
-from .settings import settings
 from .data_types import (
     BlueprintMetadata,
     BlueprintSection,
     Chunk,
     RetrievedData,
 )
+from .embedder import embedding_generator
+from .fuzzy_matcher import fuzzy_matcher
+from .qdrant_client import qdrant_manager
+from .question_id_generator import question_id_generator
+from .settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +39,30 @@ class BlueprintRetriever:
         Returns:
             RetrievedData with chunks and metadata
         """
+        return self.retrieve_batch(blueprint_path, section_id, [question_number])[0]
+
+    def retrieve_batch(
+        self,
+        blueprint_path: str,
+        section_id: str,
+        question_numbers: List[int],
+    ) -> List[RetrievedData]:
+        """Retrieve chunks for several questions of one section.
+
+        Questions that cycle onto the same topic_focus entry share chapter, topic and
+        cognitive level, and so would issue the same query. They are grouped so each
+        distinct query is embedded and searched once, and all searches for the
+        section go to Qdrant in a single batch request.
+
+        Args:
+            blueprint_path: Path to blueprint JSON file
+            section_id: Section identifier ("A", "B", "C", "D")
+            question_numbers: Question numbers within section (1-based)
+
+        Returns:
+            RetrievedData for each question, in the order of question_numbers
+        """
+        section = None
         try:
             # Step 1: Load and parse blueprint
             blueprint = self._load_blueprint(blueprint_path)
@@ -51,118 +75,190 @@ class BlueprintRetriever:
             # Step 3: Check if collection exists
             if not qdrant_manager.check_collection_exists(collection_name):
                 available = qdrant_manager.get_available_collections()
-                return self._create_error_response(
+                return self._create_error_responses(
                     section,
                     f"Collection '{collection_name}' not found. Available: {available}",
+                    len(question_numbers),
                 )
 
-            # Step 4: Determine topic for this question
-            topic_index = (question_number - 1) % len(section.topic_focus)
-            topic = section.topic_focus[topic_index]
-            chapter = self._find_chapter_for_topic(metadata, topic)
-
-            if not chapter:
-                return self._create_error_response(
-                    section,
-                    f"Topic '{topic}' not found in any chapter of syllabus scope",
+            # Step 4: Group questions by the topic_focus entry they cycle onto
+            groups: Dict[int, List[int]] = {}
+            for question_number in question_numbers:
+                topic_index = (question_number - 1) % len(section.topic_focus)
+                groups.setdefault(topic_index, []).append(question_number)
+
+            results: Dict[int, RetrievedData] = {}
+            topics_by_chapter: Dict[str, List[str]] = {}
+            queries: List[Tuple[int, str, str, float, str, str]] = []
+
+            for topic_index, numbers in groups.items():
+                topic = section.topic_focus[topic_index]
+                chapter = self._find_chapter_for_topic(metadata, topic)
+
+                if not chapter:
+                    errors = self._create_error_responses(
+                        section,
+                        f"Topic '{topic}' not found in any chapter of syllabus scope",
+                        len(numbers),
+                    )
+                    results.update(zip(numbers, errors))
+                    continue
+
+                # Step 5: Fuzzy match topic to available topics in Qdrant
+                if chapter not in topics_by_chapter:
+                    topics_by_chapter[chapter] = qdrant_manager.get_distinct_topics(
+                        collection_name, chapter
+                    )
+                matched_topic, match_score, suggestions = fuzzy_matcher.find_best_match(
+                    topic, topics_by_chapter[chapter]
                 )
 
-            # Step 5: Fuzzy match topic to available topics in Qdrant
-            available_topics = qdrant_manager.get_distinct_topics(collection_name, chapter)
-            matched_topic, match_score, suggestions = fuzzy_matcher.find_best_match(
-                topic, available_topics
-            )
+                if not matched_topic:
+                    errors = self._create_error_responses(
+                        section,
+                        f"Topic '{topic}' not found. Did you mean: {', '.join(suggestions[:3])}?",
+                        len(numbers),
+                    )
+                    results.update(zip(numbers, errors))
+                    continue
+
+                cognitive_level = section.cognitive_level_hint[
+                    topic_index % len(section.cognitive_level_hint)
+                ]
+                query_text = f"{chapter} {matched_topic} {cognitive_level}"
+                queries.append(
+                    (topic_index, chapter, matched_topic, match_score, cognitive_level, query_text)
+                )
 
-            if not matched_topic:
-                return self._create_error_response(
-                    section,
-                    f"Topic '{topic}' not found. Did you mean: {', '.join(suggestions[:3])}?",
+            if queries:
+                # Step 6: Generate query embeddings, one per distinct query
+                query_vectors = embedding_generator.generate_embeddings_batch(
+                    [query[5] for query in queries]
                 )
 
-            # Step 6: Generate query embedding
-            cognitive_level = section.cognitive_level_hint[
-                topic_index % len(section.cognitive_level_hint)
-            ]
-            query_text = f"{chapter} {matched_topic} {cognitive_level}"
-            query_vector = embedding_generator.generate_embedding(query_text)
-
-            # Step 7: Search Qdrant with hybrid approach
-            filter_conditions = {"chapter": chapter}
-            raw_chunks = qdrant_manager.search_by_vector(
-                collection_name=collection_name,
-                query_vector=query_vector,
-                filter_conditions=filter_conditions,
-                limit=settings.retrieval.max_chunks * 2,  # Get extra for mixing
-            )
-
-            if not raw_chunks:
-                return self._create_error_response(
-                    section,
-                    f"No content found for {chapter}/{matched_topic}",
+                # Step 7: Search Qdrant, all distinct queries in one request
+                chunk_lists = qdrant_manager.search_by_vectors_batch(
+                    collection_name=collection_name,
+                    searches=[
+                        (query_vector, {"chapter": query[1]})
+                        for query, query_vector in zip(queries, query_vectors)
+                    ],
+                    limit=settings.retrieval.max_chunks * 2,  # Get extra for mixing
                 )
 
-            # Step 8: Mix chunks based on question format
-            mixed_chunks = chunk_mixer.mix_chunks(raw_chunks, section.question_format)
-
-            # Step 9: Generate question ID
-            question_id = question_id_generator.generate_id(
-                subject=metadata.subject,
-                class_level=metadata.class_level,
-                chapter=chapter,
-                question_format=section.question_format,
-                question_number=question_number,
-            )
-
-            # Step 10: Determine difficulty and nature
-            difficulty = self._calculate_difficulty(section, question_number)
-            nature = section.allowed_question_natures[
-                topic_index % len(section.allowed_question_natures)
-            ]
-
-            # Step 11: Build response
-            return RetrievedData(
-                question_id=question_id,
-                chapter=chapter,
-                topic=matched_topic,
-                question_format=section.question_format,
-                marks=section.marks_per_question,
-                difficulty=difficulty,
-                bloom_level=cognitive_level,
-                nature=nature,
-                has_diagram=False,  # Will be detected by question assembler or LLM
-                chunks_used=len(mixed_chunks),
-                chunks=mixed_chunks,
-                blueprint_reference={
-                    "section_id": section.section_id,
-                    "section_title": section.title,
-                    "cognitive_level_hint": section.cognitive_level_hint,
-                    "allowed_question_natures": section.allowed_question_natures,
-                },
-                retrieval_metadata={
-                    "collection": collection_name,
-                    "embedding_model": settings.openai.embedding_model,
-                    "query_text": query_text,
-                    "topic_match_score": match_score,
-                    "chunks_theory": len(
-                        [c for c in mixed_chunks if c.chunk_type.value == "THEORY"]
-                    ),
-                    "chunks_worked_example": len(
-                        [c for c in mixed_chunks if c.chunk_type.value == "WORKED_EXAMPLE"]
-                    ),
-                    "chunks_exercise": len(
-                        [c for c in mixed_chunks if c.chunk_type.value == "EXERCISE_PATTERN"]
-                    ),
-                },
-                error=None,
-            )
+                for query, raw_chunks in zip(queries, chunk_lists):
+                    (
+                        topic_index,
+                        chapter,
+                        matched_topic,
+                        match_score,
+                        cognitive_level,
+                        query_text,
+                    ) = query
+                    numbers = groups[topic_index]
+
+                    if not raw_chunks:
+                        errors = self._create_error_responses(
+                            section,
+                            f"No content found for {chapter}/{matched_topic}",
+                            len(numbers),
+                        )
+                        results.update(zip(numbers, errors))
+                        continue
+
+                    # Step 8: Mix chunks based on question format
+                    mixed_chunks = chunk_mixer.mix_chunks(raw_chunks, section.question_format)
+
+                    for question_number in numbers:
+                        results[question_number] = self._build_retrieved_data(
+                            metadata=metadata,
+                            section=section,
+                            collection_name=collection_name,
+                            question_number=question_number,
+                            topic_index=topic_index,
+                            chapter=chapter,
+                            matched_topic=matched_topic,
+                            match_score=match_score,
+                            cognitive_level=cognitive_level,
+                            query_text=query_text,
+                            mixed_chunks=list(mixed_chunks),
+                        )
+
+            return [results[question_number] for question_number in question_numbers]
 
         except FileNotFoundError as e:
-            return self._create_error_response(None, f"Blueprint file not found: {e}")
+            error_message = f"Blueprint file not found: {e}"
         except json.JSONDecodeError as e:
-            return self._create_error_response(None, f"Invalid JSON in blueprint: {e}")
+            error_message = f"Invalid JSON in blueprint: {e}"
         except Exception as e:
             logger.exception("Unexpected error during retrieval")
-            return self._create_error_response(None, f"Retrieval error: {e}")
+            error_message = f"Retrieval error: {e}"
+        return self._create_error_responses(None, error_message, len(question_numbers))
+
+    def _build_retrieved_data(
+        self,
+        metadata: BlueprintMetadata,
+        section: BlueprintSection,
+        collection_name: str,
+        question_number: int,
+        topic_index: int,
+        chapter: str,
+        matched_topic: str,
+        match_score: float,
+        cognitive_level: str,
+        query_text: str,
+        mixed_chunks: List[Chunk],
+    ) -> RetrievedData:
+        """Build the RetrievedData for one question from its group's search results."""
+        # Step 9: Generate question ID
+        question_id = question_id_generator.generate_id(
+            subject=metadata.subject,
+            class_level=metadata.class_level,
+            chapter=chapter,
+            question_format=section.question_format,
+            question_number=question_number,
+        )
+
+        # Step 10: Determine difficulty and nature
+        difficulty = self._calculate_difficulty(section, question_number)
+        nature = section.allowed_question_natures[
+            topic_index % len(section.allowed_question_natures)
+        ]
+
+        # Step 11: Build response
+        return RetrievedData(
+            question_id=question_id,
+            chapter=chapter,
+            topic=matched_topic,
+            question_format=section.question_format,
+            marks=section.marks_per_question,
+            difficulty=difficulty,
+            bloom_level=cognitive_level,
+            nature=nature,
+            has_diagram=False,  # Will be detected by question assembler or LLM
+            chunks_used=len(mixed_chunks),
+            chunks=mixed_chunks,
+            blueprint_reference={
+                "section_id": section.section_id,
+                "section_title": section.title,
+                "cognitive_level_hint": section.cognitive_level_hint,
+                "allowed_question_natures": section.allowed_question_natures,
+            },
+            retrieval_metadata={
+                "collection": collection_name,
+                "embedding_model": settings.openai.embedding_model,
+                "query_text": query_text,
+                "topic_match_score": match_score,
+                "chunks_theory": len([c for c in mixed_chunks if c.chunk_type.value == "THEORY"]),
+                "chunks_worked_example": len(
+                    [c for c in mixed_chunks if c.chunk_type.value == "WORKED_EXAMPLE"]
+                ),
+                "chunks_exercise": len(
+                    [c for c in mixed_chunks if c.chunk_type.value == "EXERCISE_PATTERN"]
+                ),
+            },
+            error=None,
+        )
 
     def _load_blueprint(self, blueprint_path: str) -> Dict[str, Any]:
         """Load blueprint JSON file."""
@@ -227,14 +323,23 @@ class BlueprintRetriever:
         else:
             return "hard"
 
-    def _create_error_response(
+    def _create_error_responses(
         self,
         section: Optional[BlueprintSection],
         error_message: str,
-    ) -> RetrievedData:
-        """Create error response."""
+        count: int,
+    ) -> List[RetrievedData]:
+        """Create one error response per question, logging the error once."""
         logger.error(f"Retrieval error: {error_message}")
 
+        return [self._build_error_response(section, error_message) for _ in range(count)]
+
+    def _build_error_response(
+        self,
+        section: Optional[BlueprintSection],
+        error_message: str,
+    ) -> RetrievedData:
+        """Create error response."""
         return RetrievedData(
             question_id="",
             chapter="",
@@ -30,6 +30,12 @@ class RetrievalSettings(BaseModel):
     max_chunks: int = Field(default=10, description="Maximum chunks to retrieve per query")
     similarity_threshold: float = Field(default=0.7, description="Minimum similarity score (0-1)")
     fuzzy_match_threshold: int = Field(default=80, description="Minimum fuzzy match score (0-100)")
+    quantization_rescore: bool = Field(
+        default=True, description="Rescore quantized search hits with the original vectors"
+    )
+    quantization_oversampling: float = Field(
+        default=2.0, description="Candidates fetched per result before rescoring (>= 1.0)"
+    )
 
 
 class LLMSettings(BaseModel):
@@ -39,6 +45,10 @@ class LLMSettings(BaseModel):
     temperature: float = Field(default=0.3, description="Temperature for generation (0.0-1.0)")
     max_tokens: int = Field(default=2000, description="Maximum tokens for generation")
     timeout: int = Field(default=30, description="LLM API timeout in seconds")
+    base_url: Optional[str] = Field(
+        default=None,
+        description="OpenAI-compatible endpoint (e.g. a self-hosted vLLM server); None = OpenAI",
+    )
     quality_check_enabled: bool = Field(
         default=True, description="Enable quality self-assessment by LLM"
     )
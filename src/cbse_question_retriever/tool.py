@@ -1,19 +1,72 @@
-"""CBSE Question Retriever tool.
+"""CBSE Question Retriever tools.
 
-This tool retrieves CBSE textbook chunks from Qdrant vector database based on blueprint specifications.
+These tools retrieve CBSE textbook chunks from Qdrant vector database based on blueprint specifications.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from langchain_core.tools import tool
 
-from .retriever import retriever
 from .data_types import RetrievedData
+from .retriever import retriever
 
 logger = logging.getLogger(__name__)
 
 
+def _retrieved_data_to_dict(result: RetrievedData) -> Dict[str, Any]:
+    """Convert RetrievedData to the dictionary returned by the retrieval tools."""
+    return {
+        "question_id": result.question_id,
+        "chapter": result.chapter,
+        "topic": result.topic,
+        "question_format": result.question_format,
+        "marks": result.marks,
+        "difficulty": result.difficulty,
+        "bloom_level": result.bloom_level,
+        "nature": result.nature,
+        "has_diagram": result.has_diagram,
+        "chunks_used": result.chunks_used,
+        "chunks": [
+            {
+                "id": chunk.id,
+                "text": chunk.text,
+                "chapter": chunk.chapter,
+                "section": chunk.section,
+                "topic": chunk.topic,
+                "chunk_type": chunk.chunk_type.value,
+                "page_start": chunk.page_start,
+                "page_end": chunk.page_end,
+                "score": chunk.score,
+            }
+            for chunk in result.chunks
+        ],
+        "blueprint_reference": result.blueprint_reference,
+        "retrieval_metadata": result.retrieval_metadata,
+        "error": result.error,
+    }
+
+
+def _tool_error_response(error: Exception) -> Dict[str, Any]:
+    """Build the retrieval tool response for an unexpected exception."""
+    return {
+        "question_id": "",
+        "chapter": "",
+        "topic": "",
+        "question_format": "MCQ",
+        "marks": 0,
+        "difficulty": "",
+        "bloom_level": "",
+        "nature": "",
+        "has_diagram": False,
+        "chunks_used": 0,
+        "chunks": [],
+        "blueprint_reference": {},
+        "retrieval_metadata": {},
+        "error": f"Tool execution error: {str(error)}",
+    }
+
+
 @tool
 def generate_question_tool(
     blueprint_path: str,
@@ -76,52 +129,58 @@ def generate_question_tool(
             question_number=question_number,
         )
 
-        # Convert RetrievedData to dictionary
-        return {
-            "question_id": result.question_id,
-            "chapter": result.chapter,
-            "topic": result.topic,
-            "question_format": result.question_format,
-            "marks": result.marks,
-            "difficulty": result.difficulty,
-            "bloom_level": result.bloom_level,
-            "nature": result.nature,
-            "has_diagram": result.has_diagram,
-            "chunks_used": result.chunks_used,
-            "chunks": [
-                {
-                    "id": chunk.id,
-                    "text": chunk.text,
-                    "chapter": chunk.chapter,
-                    "section": chunk.section,
-                    "topic": chunk.topic,
-                    "chunk_type": chunk.chunk_type.value,
-                    "page_start": chunk.page_start,
-                    "page_end": chunk.page_end,
-                    "score": chunk.score,
-                }
-                for chunk in result.chunks
-            ],
-            "blueprint_reference": result.blueprint_reference,
-            "retrieval_metadata": result.retrieval_metadata,
-            "error": result.error,
-        }
+        return _retrieved_data_to_dict(result)
 
     except Exception as e:
         logger.exception("Unexpected error in generate_question_tool")
-        return {
-            "question_id": "",
-            "chapter": "",
-            "topic": "",
-            "question_format": "MCQ",
-            "marks": 0,
-            "difficulty": "",
-            "bloom_level": "",
-            "nature": "",
-            "has_diagram": False,
-            "chunks_used": 0,
-            "chunks": [],
-            "blueprint_reference": {},
-            "retrieval_metadata": {},
-            "error": f"Tool execution error: {str(e)}",
-        }
+        return _tool_error_response(e)
+
+
+@tool
+def generate_section_questions_tool(
+    blueprint_path: str,
+    section_id: str,
+    question_numbers: List[int],
+) -> List[Dict[str, Any]]:
+    """Retrieves textbook chunks from Qdrant for several questions of one section at once.
+
+    Same output as generate_question_tool, for a whole section in one call. Questions
+    that share a query are embedded and searched once, and all searches for the section
+    go to Qdrant in a single request.
+
+    Args:
+        blueprint_path: Path to the exam blueprint JSON file (e.g., "input/classes/10/mathematics/input_first_term.json")
+        section_id: Section identifier from blueprint (e.g., "A", "B", "C", "D")
+        question_numbers: Question numbers within the section (1-based indexes), e.g. [1, 2, 3, 4, 5]
+
+    Returns:
+        List with one dictionary per question, in the order of question_numbers. Each
+        dictionary has the same fields as the generate_question_tool result, including
+        its own error field, so one failed question does not hide the others.
+
+    Example:
+        >>> results = generate_section_questions_tool(
+        ...     blueprint_path="input/classes/10/mathematics/input_first_term.json",
+        ...     section_id="A",
+        ...     question_numbers=[1, 2, 3]
+        ... )
+        >>> print([r["question_id"] for r in results])
+        ["MATH-10-POL-MCQ-001", "MATH-10-TRI-MCQ-002", "MATH-10-POL-MCQ-003"]
+    """
+    try:
+        logger.info(
+            f"Retrieving questions from blueprint: {blueprint_path}, "
+            f"section: {section_id}, questions: {question_numbers}"
+        )
+
+        results: List[RetrievedData] = retriever.retrieve_batch(
+            blueprint_path=blueprint_path,
+            section_id=section_id,
+            question_numbers=question_numbers,
+        )
+
+        return [_retrieved_data_to_dict(result) for result in results]
+
+    except Exception as e:
+        logger.exception("Unexpected error in generate_section_questions_tool")
+        return [_tool_error_response(e) for _ in question_numbers]
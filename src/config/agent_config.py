@@ -1,15 +1,15 @@
 """Agent configuration for CBSE Question Paper Generator."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Mapping, Tuple
 
 
-def get_subagent_definitions() -> List[Dict]:
+def get_subagent_definitions() -> Tuple[Mapping[str, Any], ...]:
     """
     Get subagent definitions for CBSE question paper generation.
     Uses the new skill-based configuration from question_generation.config.
 
     Returns:
-        List of subagent dictionaries for create_deep_agent
+        Read-only subagent mappings for create_deep_agent
     """
     from question_generation.config import ALL_SUBAGENTS
 
@@ -2,10 +2,18 @@
 
 import os
 import base64
+import hashlib
+import threading
 from pathlib import Path
 from typing import Literal, Dict, List, Optional, Any
 from langchain_core.tools import tool
 
+# Encoded SVGs by digest of (diagram_type, description, elements). Diagram rendering is
+# deterministic, and questions on the same topic often request the same standard figure.
+_DIAGRAM_CACHE: Dict[bytes, str] = {}
+_DIAGRAM_CACHE_MAX_SIZE = 256
+_diagram_cache_lock = threading.Lock()
+
 
 def _ensure_drawsvg_installed():
     """Check if drawsvg is installed."""
@@ -18,6 +26,15 @@ def _ensure_drawsvg_installed():
         return False
 
 
+def _diagram_cache_key(description: str, diagram_type: str, elements: Dict[str, Any]) -> bytes:
+    """Digest of a diagram request.
+
+    repr keeps tuples and lists distinct, since the generators may render them differently.
+    """
+    payload = repr((diagram_type, description, elements))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
 def _generate_geometric_diagram(description: str, elements: Optional[Dict] = None) -> Optional[str]:
     """Generate geometric diagram using drawsvg."""
     if not _ensure_drawsvg_installed():
@@ -336,49 +353,60 @@ def generate_diagram_tool(
     """
     elements = elements or {}
 
-    # Generate diagram based on type
-    svg_content = None
-
-    if diagram_type == "geometric":
-        svg_content = _generate_geometric_diagram(diagram_description, elements)
-    elif diagram_type == "coordinate":
-        svg_content = _generate_coordinate_diagram(diagram_description, elements)
-    elif diagram_type == "formula":
-        svg_content = _generate_formula_diagram(diagram_description, elements)
-    elif diagram_type == "chart":
-        svg_content = _generate_chart_diagram(diagram_description, elements)
-    else:
+    if diagram_type not in ("geometric", "coordinate", "formula", "chart"):
         return {
             "success": False,
             "error": f"Unsupported diagram type: {diagram_type}",
             "diagram_type": diagram_type,
         }
 
-    # Handle generation failure
-    if not svg_content:
-        print(
-            f"Warning: Failed to generate diagram (type: {diagram_type}, description: {diagram_description[:50]}...)"
-        )
-        return {
-            "success": False,
-            "error": "Diagram generation failed",
-            "diagram_type": diagram_type,
-            "diagram_description": diagram_description,
-        }
+    cache_key = _diagram_cache_key(diagram_description, diagram_type, elements)
+    svg_base64 = _DIAGRAM_CACHE.get(cache_key)
 
-    # Encode SVG to base64
-    try:
-        svg_bytes = svg_content.encode("utf-8")
-        svg_base64 = base64.b64encode(svg_bytes).decode("utf-8")
+    if svg_base64 is None:
+        # Generate diagram based on type
+        svg_content = None
 
-        # Check size limit (10KB)
-        if len(svg_bytes) > 10240:
+        if diagram_type == "geometric":
+            svg_content = _generate_geometric_diagram(diagram_description, elements)
+        elif diagram_type == "coordinate":
+            svg_content = _generate_coordinate_diagram(diagram_description, elements)
+        elif diagram_type == "formula":
+            svg_content = _generate_formula_diagram(diagram_description, elements)
+        elif diagram_type == "chart":
+            svg_content = _generate_chart_diagram(diagram_description, elements)
+
+        # Handle generation failure
+        if not svg_content:
             print(
-                f"Warning: SVG size ({len(svg_bytes)} bytes) exceeds 10KB limit, may affect JSON portability"
+                f"Warning: Failed to generate diagram (type: {diagram_type}, description: {diagram_description[:50]}...)"
             )
-    except Exception as e:
-        print(f"Error encoding SVG to base64: {e}")
-        return {"success": False, "error": "SVG encoding failed", "diagram_type": diagram_type}
+            return {
+                "success": False,
+                "error": "Diagram generation failed",
+                "diagram_type": diagram_type,
+                "diagram_description": diagram_description,
+            }
+
+        # Encode SVG to base64
+        try:
+            svg_bytes = svg_content.encode("utf-8")
+            svg_base64 = base64.b64encode(svg_bytes).decode("ascii")
+
+            # Check size limit (10KB)
+            if len(svg_bytes) > 10240:
+                print(
+                    f"Warning: SVG size ({len(svg_bytes)} bytes) exceeds 10KB limit, may affect JSON portability"
+                )
+        except Exception as e:
+            print(f"Error encoding SVG to base64: {e}")
+            return {"success": False, "error": "SVG encoding failed", "diagram_type": diagram_type}
+
+        with _diagram_cache_lock:
+            if len(_DIAGRAM_CACHE) >= _DIAGRAM_CACHE_MAX_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                _DIAGRAM_CACHE.pop(next(iter(_DIAGRAM_CACHE)))
+            _DIAGRAM_CACHE[cache_key] = svg_base64
 
     # Build structured description
     structured_description = _build_description_from_elements(
@@ -9,23 +9,103 @@ Updated for CBSE format compliance with support for:
 
 import os
 import base64
+import copy
+import hashlib
 import json
+import multiprocessing
+import re
+import threading
 import uuid
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from langchain_core.tools import tool
+# python-docx builds and serializes its XML with lxml (a hard dependency of
+# python-docx, there is no ElementTree fallback), so no extra setup is needed here
+from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 
-
-# Cache directory for temporary PNG files
-TEMP_DIR = Path(__file__).parent.parent / "cache" / "temp"
-TEMP_DIR.mkdir(parents=True, exist_ok=True)
-
-# Output directory for DOCX files
+# orjson parses large papers (base64 SVG payloads) much faster; stdlib json is the fallback
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# fastjsonschema is optional: when installed, papers are checked against
+# PAPER_SCHEMA before any DOCX work starts
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# cairosvg is optional: without it (or without the native cairo library, which
+# surfaces as OSError) diagrams are skipped but the DOCX is still generated.
+try:
+    import cairosvg
+
+    HAVE_CAIROSVG = True
+except (ImportError, OSError):
+    cairosvg = None
+    HAVE_CAIROSVG = False
+    print("Warning: cairosvg not installed. SVG to PNG conversion will be skipped.")
+    print("Diagrams in DOCX will be missing, but document will still be generated.")
+
+# Output directory for DOCX files (created on first save, not at import)
 DOCX_OUTPUT_DIR = Path(__file__).parent.parent / "output" / "docx"
-DOCX_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Write buffer for saving the DOCX
+DOCX_WRITE_BUFFER_SIZE = 1 << 20
+
+# Papers with at least this many diagrams render them in worker processes
+PROCESS_POOL_MIN_DIAGRAMS = 4
+
+# Worker processes for diagram rendering, started on first use and shared by later
+# papers. They are spawned rather than forked: the agent runtime is multi-threaded,
+# and a forked child can inherit locks held by other threads.
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+# Diagrams are inserted 4 inches wide; render them at exactly that size (96 DPI)
+DIAGRAM_WIDTH_INCHES = 4
+DIAGRAM_RENDER_PX = DIAGRAM_WIDTH_INCHES * 96
+
+# Strip <filter> elements before rasterizing; large filter regions dominate cairosvg cost
+CAIROSVG_CLAMP_FILTERS = False
+_SVG_FILTER_RE = re.compile(rb"<filter\b.*?</filter\s*>|<filter\b[^>]*/>", re.DOTALL)
+_SVG_FILTER_ATTR_RE = re.compile(rb"\sfilter\s*=\s*(\"[^\"]*\"|'[^']*')")
+
+# Rendered diagram PNGs, keyed by (SHA-1 of the SVG, width) and reused across papers
+PNG_CACHE_SIZE = 256
+_png_cache: "OrderedDict[Tuple[bytes, int], bytes]" = OrderedDict()
+_png_cache_lock = threading.Lock()
+
+# Shared formatting values (Length and RGBColor are immutable, so one instance
+# can be reused for every run/paragraph instead of being rebuilt per call)
+_BLACK = RGBColor(0x00, 0x00, 0x00)
+_GREY = RGBColor(0x80, 0x80, 0x80)
+_PT_12 = Pt(12)
+_PT_11 = Pt(11)
+_PT_10 = Pt(10)
+_PT_8 = Pt(8)
+_PT_6 = Pt(6)
+_PT_3 = Pt(3)
+_IN_025 = Inches(0.25)
+_IN_05 = Inches(0.5)
+_IN_4 = Inches(DIAGRAM_WIDTH_INCHES)
+_IN_1 = Inches(1)
+
+# Header line templates, filled by _create_cbse_header
+_HEADER_SUBJECT_TMPL = "{subject} (Class {class})"
+_HEADER_TIME_TMPL = "TIME: {hours} HOURS\t\tMAX. MARKS: {marks}"
 
 # CBSE Section configuration
 CBSE_SECTIONS = {
@@ -36,33 +116,101 @@ CBSE_SECTIONS = {
     "E": {"title": "Case Study Based Questions", "marks_per_question": 4},
 }
 
+# Sections whose last 2 questions are printed as internal choice (OR) pairs
+_INTERNAL_CHOICE_SECTIONS = frozenset({"B", "C", "D"})
+
+# MCQ option letters in display order
+_MCQ_OPTION_LETTERS = ("A", "B", "C", "D")
+
+# CBSE standard general instructions, numbered once at import time. The first
+# instruction depends on the section count and is formatted per document.
+_SECTION_COUNT_INSTRUCTION = "1. This Question Paper consists of {} Sections A, B, C, D and E."
+_GENERAL_INSTRUCTIONS = tuple(
+    f"{i}. {instruction}"
+    for i, instruction in enumerate(
+        [
+            "Section A has {X} MCQs carrying 1 mark each.",
+            "Section B has {Y} Short Answer questions carrying 2 marks each.",
+            "Section C has {Z} Short Answer questions carrying 3 marks each.",
+            "Section D has {W} Long Answer questions carrying 5 marks each.",
+            "Section E has {V} Case Study based questions carrying 4 marks each.",
+            "All questions are compulsory.",
+            "Internal choice is provided in some questions.",
+            "Use of calculators is not allowed.",
+            "Draw neat and clean figures wherever required.",
+        ],
+        2,
+    )
+)
+
+# Structure generate_docx_tool relies on. Only values the renderer would fail on are
+# constrained: text fields are formatted into f-strings, so any value renders (null
+# included), and unknown keys are allowed.
+_NUMBER_OR_NULL = {"type": ["number", "null"]}
+_METADATA_SCHEMA = {
+    "type": ["object", "null"],
+    "properties": {
+        "subject": {"type": "string"},
+        "exam_type": {"type": "string"},
+        "duration_minutes": {"type": "number"},
+    },
+}
+PAPER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "exam_metadata": _METADATA_SCHEMA,
+        "paper_metadata": _METADATA_SCHEMA,
+        "sections": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "section_id": {"type": ["string", "number", "null"]},
+                    "marks_per_question": _NUMBER_OR_NULL,
+                    "questions": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "marks": {"type": "number"},
+                                "options": {"type": ["object", "array", "null"]},
+                                "diagram_svg_base64": {"type": ["string", "null"]},
+                                "sub_questions": {
+                                    "type": ["array", "null"],
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {"marks": {"type": "number"}},
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
 
-def _ensure_cairosvg_installed():
-    """Check if cairosvg is installed."""
-    try:
-        import cairosvg
+# Compiled once per process; validation itself is then a plain function call
+_validate_paper = fastjsonschema.compile(PAPER_SCHEMA) if fastjsonschema is not None else None
 
-        return True
-    except ImportError:
-        print("Warning: cairosvg not installed. SVG to PNG conversion will be skipped.")
-        print("Diagrams in DOCX will be missing, but document will still be generated.")
-        return False
 
-
-def _svg_base64_to_png(svg_base64: str, width: int = 400) -> Optional[bytes]:
+def _svg_base64_to_png(svg_base64: str, width: int = DIAGRAM_RENDER_PX) -> Optional[bytes]:
     """Convert base64-encoded SVG to PNG using cairosvg."""
-    if not _ensure_cairosvg_installed():
+    if not HAVE_CAIROSVG:
         print("Warning: cairosvg not available, cannot convert SVG to PNG")
         return None
 
     try:
-        import cairosvg
-
         # Decode base64 SVG
         svg_content = base64.b64decode(svg_base64)
+        if CAIROSVG_CLAMP_FILTERS:
+            svg_content = _SVG_FILTER_ATTR_RE.sub(b"", _SVG_FILTER_RE.sub(b"", svg_content))
 
-        # Convert SVG to PNG
-        png_bytes = cairosvg.svg2png(bytestring=svg_content, output_width=width, write_to=None)
+        # Convert SVG to PNG; height follows the SVG's aspect ratio
+        png_bytes = cairosvg.svg2png(
+            bytestring=svg_content, output_width=width, output_height=None, write_to=None
+        )
 
         return png_bytes
 
@@ -71,13 +219,160 @@ def _svg_base64_to_png(svg_base64: str, width: int = 400) -> Optional[bytes]:
         return None
 
 
-def _generate_docx_filename(metadata: Dict) -> str:
-    """Generate DOCX filename from metadata."""
+def _png_cache_key(svg_base64: str, width: int) -> Tuple[bytes, int]:
+    """Build the PNG cache key for a diagram: SHA-1 of the encoded SVG plus render width."""
+    return hashlib.sha1(svg_base64.encode("utf-8")).digest(), width
+
+
+def _cached_png(cache_key: Tuple[bytes, int]) -> Optional[bytes]:
+    """Return a previously rendered PNG for the cache key, or None on a miss."""
+    with _png_cache_lock:
+        png_bytes = _png_cache.get(cache_key)
+        if png_bytes is not None:
+            _png_cache.move_to_end(cache_key)
+        return png_bytes
+
+
+def _get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared diagram process pool, or None if processes are unavailable."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            try:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except (OSError, NotImplementedError) as e:
+                print(f"Warning: process pool unavailable ({e}), rendering diagrams in threads")
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken process pool so the next paper starts a fresh one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def _remember_png(cache_key: Tuple[bytes, int], future: Future[Optional[bytes]]) -> None:
+    """Store a finished render in the PNG cache (failed renders are not cached)."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    png_bytes = future.result()
+    if not png_bytes:
+        return
+
+    with _png_cache_lock:
+        _png_cache[cache_key] = png_bytes
+        _png_cache.move_to_end(cache_key)
+        while len(_png_cache) > PNG_CACHE_SIZE:
+            _png_cache.popitem(last=False)
+
+
+def _question_kind(question: Dict, section_id: str, index: int, num_questions: int) -> int:
+    """Classify a question into one of the _KIND_* layout kinds.
+
+    Internal choice only applies to the last 2 questions of Sections B, C and D.
+    Section E and questions with sub-parts use the case study layout.
+    """
+    if (
+        question.get("internal_choice", False)
+        and section_id in _INTERNAL_CHOICE_SECTIONS
+        and index >= num_questions - 2
+    ):
+        return _KIND_INTERNAL_CHOICE
+    if section_id == "E" or question.get("has_sub_questions"):
+        return _KIND_CASE_STUDY
+    return _KIND_NORMAL
+
+
+def _start_diagram_renders(
+    sections: List[Dict],
+) -> Dict[Tuple[int, int], Future[Optional[bytes]]]:
+    """Start SVG to PNG conversion for every diagram in the paper in the background.
+
+    Rendering overlaps with the DOCX layout loop, which only waits on a diagram's
+    future once it reaches that question. Diagram-heavy papers are rendered in the
+    shared worker process pool so SVG parsing and rasterization run in parallel across
+    cores; smaller papers use a thread pool, where the hand-off would outweigh the gain.
+
+    Args:
+        sections: Section dicts from the JSON paper
+
+    Returns:
+        Dict mapping (section_index, question_index) to a Future of PNG bytes
+    """
+    jobs = [
+        ((section_index, question_index), question["diagram_svg_base64"])
+        for section_index, section_data in enumerate(sections)
+        for question_index, question in enumerate(section_data.get("questions", []))
+        if (question.get("has_diagram") or question.get("diagram_needed"))
+        and question.get("diagram_svg_base64")
+    ]
+    if not jobs:
+        return {}
+
+    # Serve previously rendered diagrams from the PNG cache; a diagram reused
+    # within this paper is rendered once and its questions share the future
+    width = DIAGRAM_RENDER_PX
+    futures: Dict[Tuple[int, int], Future[Optional[bytes]]] = {}
+    misses: Dict[Tuple[bytes, int], Tuple[str, List[Tuple[int, int]]]] = {}
+    for key, svg in jobs:
+        cache_key = _png_cache_key(svg, width)
+        if cache_key in misses:
+            misses[cache_key][1].append(key)
+            continue
+        png_bytes = _cached_png(cache_key)
+        if png_bytes is not None:
+            futures[key] = Future()
+            futures[key].set_result(png_bytes)
+        else:
+            misses[cache_key] = (svg, [key])
+
+    if not misses:
+        return futures
+
+    process_pool = _get_process_pool() if len(misses) >= PROCESS_POOL_MIN_DIAGRAMS else None
+    if process_pool is not None:
+        try:
+            submitted = [
+                (process_pool.submit(_svg_base64_to_png, svg, width), cache_key, keys)
+                for cache_key, (svg, keys) in misses.items()
+            ]
+        except (BrokenExecutor, RuntimeError) as e:
+            # A worker died in an earlier paper, or workers cannot be spawned here
+            # (e.g. an unguarded __main__); render this paper in threads
+            print(f"Warning: process pool failed ({type(e).__name__}), using threads")
+            _discard_process_pool(process_pool)
+            process_pool = None
+
+    if process_pool is None:
+        thread_pool = ThreadPoolExecutor(max_workers=min(len(misses), os.cpu_count() or 1))
+        submitted = [
+            (thread_pool.submit(_svg_base64_to_png, svg, width), cache_key, keys)
+            for cache_key, (svg, keys) in misses.items()
+        ]
+        # Already-submitted renders keep running; this only releases the pool afterwards
+        thread_pool.shutdown(wait=False)
+
+    for future, cache_key, keys in submitted:
+        future.add_done_callback(partial(_remember_png, cache_key))
+        for key in keys:
+            futures[key] = future
+
+    return futures
+
+
+def _generate_docx_filename(metadata: Dict, generated_at: datetime) -> str:
+    """Generate DOCX filename from metadata and the generation timestamp."""
     subject = metadata.get("subject", "mathematics").lower().replace(" ", "_")
     cls = metadata.get("class", "10")
     exam_type = metadata.get("exam_type", "examination").lower().replace(" ", "_")
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    short_id = str(uuid.uuid4())[:5]
+    timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
+    short_id = uuid.uuid4().hex[:5]
 
     return f"{subject}_class{cls}_{exam_type}_{timestamp}_{short_id}.docx"
 
@@ -95,31 +390,35 @@ def _create_cbse_header(doc, metadata: Dict):
     header_para.text = "CENTRAL BOARD OF SECONDARY EDUCATION"
     header_para.runs[0].bold = True
     header_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    header_para.runs[0].font.size = Pt(12)
-    header_para.runs[0].font.color.rgb = RGBColor(0, 0, 0)
+    header_para.runs[0].font.size = _PT_12
+    header_para.runs[0].font.color.rgb = _BLACK
+
+    # Header line values, with CBSE defaults for anything missing from the metadata
+    fields = {
+        "subject": metadata.get("subject", "Subject").upper(),
+        "class": metadata.get("class", "10"),
+        "hours": metadata.get("duration_minutes", 180) // 60,
+        "marks": metadata.get("total_marks", 80),
+    }
 
     # Add subject and class
     subject_para = header.add_paragraph()
-    subject_para.text = (
-        f"{metadata.get('subject', 'Subject').upper()} (Class {metadata.get('class', '10')})"
-    )
+    subject_para.text = _HEADER_SUBJECT_TMPL.format_map(fields)
     subject_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    subject_para.runs[0].font.size = Pt(11)
+    subject_para.runs[0].font.size = _PT_11
     subject_para.runs[0].bold = True
 
     # Add exam type
     exam_para = header.add_paragraph()
     exam_para.text = metadata.get("exam_type", "EXAMINATION").upper()
     exam_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    exam_para.runs[0].font.size = Pt(10)
+    exam_para.runs[0].font.size = _PT_10
 
     # Add time and marks
     time_para = header.add_paragraph()
-    duration_hours = metadata.get("duration_minutes", 180) // 60
-    total_marks = metadata.get("total_marks", 80)
-    time_para.text = f"TIME: {duration_hours} HOURS\t\tMAX. MARKS: {total_marks}"
+    time_para.text = _HEADER_TIME_TMPL.format_map(fields)
     time_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    time_para.runs[0].font.size = Pt(10)
+    time_para.runs[0].font.size = _PT_10
     time_para.runs[0].bold = True
 
 
@@ -129,32 +428,77 @@ def _create_cbse_general_instructions(doc, num_sections: int = 5):
     title_para = doc.add_paragraph()
     title_para.add_run("General Instructions:").bold = True
     title_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    title_para.runs[0].font.size = Pt(11)
-    title_para.spacing_after = Pt(6)
-
-    # CBSE standard instructions
-    instructions = [
-        f"This Question Paper consists of {num_sections} Sections A, B, C, D and E.",
-        "Section A has {X} MCQs carrying 1 mark each.",
-        "Section B has {Y} Short Answer questions carrying 2 marks each.",
-        "Section C has {Z} Short Answer questions carrying 3 marks each.",
-        "Section D has {W} Long Answer questions carrying 5 marks each.",
-        "Section E has {V} Case Study based questions carrying 4 marks each.",
-        "All questions are compulsory.",
-        "Internal choice is provided in some questions.",
-        "Use of calculators is not allowed.",
-        "Draw neat and clean figures wherever required.",
-    ]
+    title_para.runs[0].font.size = _PT_11
+    title_para.spacing_after = _PT_6
 
-    for i, instruction in enumerate(instructions, 1):
-        inst_para = doc.add_paragraph()
-        inst_para.add_run(f"{i}. {instruction}")
-        inst_para.paragraph_format.left_indent = Inches(0.25)
-        inst_para.paragraph_format.space_after = Pt(3)
+    # CBSE standard instructions (only the section count varies per paper)
+    instructions = (_SECTION_COUNT_INSTRUCTION.format(num_sections),) + _GENERAL_INSTRUCTIONS
+
+    # One indented paragraph for all instructions; python-docx turns each "\n" into a <w:br/>
+    inst_para = doc.add_paragraph()
+    inst_para.add_run("\n".join(instructions))
+    inst_para.paragraph_format.left_indent = _IN_025
+    inst_para.paragraph_format.space_after = _PT_3
 
     doc.add_paragraph()  # Empty line after instructions
 
 
+def _build_question_paragraph_proto():
+    """Build the prototype ``w:p`` for question stems: a bold number run and a text run."""
+    para = OxmlElement("w:p")
+
+    num_run = OxmlElement("w:r")
+    num_props = OxmlElement("w:rPr")
+    num_props.append(OxmlElement("w:b"))
+    num_run.append(num_props)
+    num_run.append(OxmlElement("w:t"))
+
+    text_run = OxmlElement("w:r")
+    text = OxmlElement("w:t")
+    text.set(qn("xml:space"), "preserve")
+    text_run.append(text)
+
+    para.append(num_run)
+    para.append(text_run)
+    return para
+
+
+_QUESTION_PARA_PROTO = _build_question_paragraph_proto()
+
+# Characters python-docx expands into their own elements (w:tab, w:br, ...)
+_RUN_SPECIAL_CHARS_RE = re.compile(r"[\t\n\r\f]")
+
+
+def _fast_add_question_paragraph(doc, q_num: int, text: str) -> None:
+    """Append a "<b>N.</b> text" question paragraph by cloning a prebuilt XML prototype.
+
+    Skips python-docx's Paragraph/Run object construction for the most common
+    paragraph in a paper. Text with tabs or line breaks goes through add_run so
+    they are still expanded into the proper run elements.
+
+    Args:
+        doc: Document object to append the paragraph to
+        q_num: Question number rendered in bold
+        text: Question text run, including its leading space and marks suffix
+    """
+    if _RUN_SPECIAL_CHARS_RE.search(text):
+        q_para = doc.add_paragraph()
+        q_para.add_run(f"{q_num}.").bold = True
+        q_para.add_run(text)
+        return
+
+    para = copy.deepcopy(_QUESTION_PARA_PROTO)
+    para[0][1].text = f"{q_num}."
+    para[1][0].text = text
+    # Body content must stay ahead of the trailing section properties element
+    body = doc.element.body
+    sect_pr = body.find(qn("w:sectPr"))
+    if sect_pr is not None:
+        sect_pr.addprevious(para)
+    else:
+        body.append(para)
+
+
 def _format_mcq_options(options: Dict[str, str], doc) -> None:
     """Format MCQ options in CBSE style.
 
@@ -164,14 +508,28 @@ def _format_mcq_options(options: Dict[str, str], doc) -> None:
     """
     # Create options paragraph with indentation
     options_para = doc.add_paragraph()
-    options_para.paragraph_format.left_indent = Inches(0.5)
+    options_para.paragraph_format.left_indent = _IN_05
+
+    # Add all options as a single run; python-docx turns each "\n" into a <w:br/>
+    options_para.add_run(
+        "".join(
+            f"{letter}) {options[letter]}\n" for letter in _MCQ_OPTION_LETTERS if letter in options
+        )
+    )
 
-    # Add each option
-    for letter in ["A", "B", "C", "D"]:
-        if letter in options:
-            opt_text = options[letter]
-            options_para.add_run(f"{letter}) {opt_text}")
-            options_para.add_run("\n")
+
+def _format_normal_question(question: Dict, doc, q_num: int, q_marks: int) -> int:
+    """Format a regular numbered question with its marks.
+
+    Returns:
+        question_number_used
+    """
+    q_text = question.get("question_text", "")
+    _fast_add_question_paragraph(
+        doc, q_num, f" {q_text} ({q_marks} mark{'s' if q_marks > 1 else ''})"
+    )
+
+    return q_num
 
 
 def _format_internal_choice(question: Dict, doc, q_num: int, q_marks: int) -> Tuple[int, bool]:
@@ -183,16 +541,14 @@ def _format_internal_choice(question: Dict, doc, q_num: int, q_marks: int) -> Tu
     # Check if this is an internal choice question
     if question.get("internal_choice"):
         # Format as "21. [Question text] OR"
-        q_para = doc.add_paragraph()
-        q_para.add_run(f"{q_num}.").bold = True
         q_text = question.get("question_text", "")
-        q_para.add_run(f" {q_text} ({q_marks} marks)")
+        _fast_add_question_paragraph(doc, q_num, f" {q_text} ({q_marks} marks)")
 
         # Add OR on next line
         or_para = doc.add_paragraph()
         or_para.add_run("OR").bold = True
         or_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        or_para.runs[0].font.size = Pt(10)
+        or_para.runs[0].font.size = _PT_10
 
         return q_num, True
 
@@ -206,17 +562,15 @@ def _format_case_study_question(question: Dict, doc, q_num: int, q_marks: int) -
         question_number_used
     """
     # Main question text (case study passage)
-    q_para = doc.add_paragraph()
-    q_para.add_run(f"{q_num}.").bold = True
     q_text = question.get("question_text", "")
-    q_para.add_run(f" {q_text}")
+    _fast_add_question_paragraph(doc, q_num, f" {q_text}")
 
     # Add sub-questions if present
     sub_questions = question.get("sub_questions", [])
     if sub_questions:
         for sub_q in sub_questions:
             sub_para = doc.add_paragraph()
-            sub_para.paragraph_format.left_indent = Inches(0.5)
+            sub_para.paragraph_format.left_indent = _IN_05
             part = sub_q.get("part", "")
             marks = sub_q.get("marks", 0)
             sub_para.add_run(f"{part} ")
@@ -231,7 +585,7 @@ def _format_case_study_question(question: Dict, doc, q_num: int, q_marks: int) -
         ]
         for sub_q in default_parts:
             sub_para = doc.add_paragraph()
-            sub_para.paragraph_format.left_indent = Inches(0.5)
+            sub_para.paragraph_format.left_indent = _IN_05
             sub_para.add_run(
                 f"{sub_q['part']} ({sub_q['marks']} mark{'s' if sub_q['marks'] > 1 else ''})"
             )
@@ -243,6 +597,60 @@ def _format_case_study_question(question: Dict, doc, q_num: int, q_marks: int) -
     return q_num
 
 
+def _embed_diagram(doc, question: Dict, png_future: Optional[Future[Optional[bytes]]]) -> bool:
+    """Embed a question's diagram as a captioned, centered picture.
+
+    Args:
+        doc: Document object to add the figure to
+        question: Question dict with has_diagram/diagram_needed and diagram_svg_base64
+        png_future: Pending PNG render for this question from _start_diagram_renders
+
+    Returns:
+        True if a diagram was embedded, False otherwise
+    """
+    if not (question.get("has_diagram") or question.get("diagram_needed")):
+        return False
+    if not question.get("diagram_svg_base64") or png_future is None:
+        return False
+
+    try:
+        png_bytes = png_future.result()
+    except Exception as e:
+        # The worker rendering this diagram died, so the shared pool is broken for
+        # every later paper too; drop it and render this diagram here instead
+        print(f"Warning: diagram render failed ({type(e).__name__}), rendering inline")
+        if isinstance(e, BrokenExecutor):
+            broken_pool = _process_pool
+            if broken_pool is not None:
+                _discard_process_pool(broken_pool)
+        png_bytes = _svg_base64_to_png(question["diagram_svg_base64"])
+    if not png_bytes:
+        return False
+
+    diagram_para = doc.add_paragraph()
+    diagram_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    desc = question.get("diagram_description", "Diagram")
+    diagram_para.add_run(f"Figure: {desc}").italic = True
+
+    # Stream the PNG straight from memory, no temporary file needed
+    doc.add_picture(BytesIO(png_bytes), width=_IN_4)
+
+    return True
+
+
+# Question layout kinds; each value indexes _QUESTION_FORMATTERS
+_KIND_NORMAL = 0
+_KIND_CASE_STUDY = 1
+_KIND_INTERNAL_CHOICE = 2
+
+_QUESTION_FORMATTERS = (
+    _format_normal_question,
+    _format_case_study_question,
+    _format_internal_choice,
+)
+
+
 @tool
 def generate_docx_tool(
     json_paper_path: str, output_docx_path: Optional[str] = None
@@ -277,32 +685,39 @@ def generate_docx_tool(
         )
     """
     try:
-        from docx import Document
-
         # Read JSON paper
         json_path = Path(json_paper_path)
         if not json_path.exists():
             return {"success": False, "error": f"JSON file not found: {json_paper_path}"}
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            paper_data = json.load(f)
+        paper_data = _json_loads(json_path.read_bytes())
+
+        # Fail fast on malformed papers instead of part-way through the build
+        if _validate_paper is not None:
+            try:
+                _validate_paper(paper_data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return {"success": False, "error": f"Invalid question paper JSON: {e.message}"}
 
         # Create Word document
         doc = Document()
 
         # Setup margins (CBSE standard: 1 inch on all sides)
         for section in doc.sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
+            section.top_margin = _IN_1
+            section.bottom_margin = _IN_1
+            section.left_margin = _IN_1
+            section.right_margin = _IN_1
 
         # Create header
-        metadata = paper_data.get("exam_metadata", paper_data.get("paper_metadata", {}))
+        metadata = paper_data.get("exam_metadata") or paper_data.get("paper_metadata") or {}
         _create_cbse_header(doc, metadata)
 
-        # Add general instructions
+        # Start rendering diagrams in the background while the document is laid out
         sections = paper_data.get("sections", [])
+        diagram_futures = _start_diagram_renders(sections)
+
+        # Add general instructions
         _create_cbse_general_instructions(doc, num_sections=len(sections))
 
         # Track overall question number (Q1, Q2, Q3... across all sections)
@@ -310,187 +725,140 @@ def generate_docx_tool(
         questions_count = 0
         diagrams_embedded = 0
 
-        for section_data in sections:
+        last_section_index = len(sections) - 1
+        for section_index, section_data in enumerate(sections):
             section_id = section_data.get("section_id", "")
-            section_title = section_data.get(
-                "title", CBSE_SECTIONS.get(section_id, {}).get("title", "")
-            )
+            section_defaults = CBSE_SECTIONS.get(section_id) or {}
+            section_title = section_data.get("title") or section_defaults.get("title", "")
 
             # Get marks per question
-            marks_per_q = section_data.get(
-                "marks_per_question", CBSE_SECTIONS.get(section_id, {}).get("marks_per_question", 1)
+            marks_per_q = section_data.get("marks_per_question") or section_defaults.get(
+                "marks_per_question", 1
             )
 
             # Calculate section marks
-            num_questions = len(section_data.get("questions", []))
+            questions = section_data.get("questions", [])
+            num_questions = len(questions)
             section_total_marks = num_questions * marks_per_q
 
             # Section heading with CBSE format
             section_heading = doc.add_paragraph()
             section_heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
             section_heading.add_run(f"SECTION {section_id}").bold = True
-            section_heading.runs[0].font.size = Pt(12)
-            section_heading.runs[0].font.color.rgb = RGBColor(0, 0, 0)
+            section_heading.runs[0].font.size = _PT_12
+            section_heading.runs[0].font.color.rgb = _BLACK
 
             # Section subtitle and marks
             section_sub = doc.add_paragraph()
             section_sub.alignment = WD_ALIGN_PARAGRAPH.CENTER
             section_sub.add_run(f"{section_title}").italic = True
-            section_sub.runs[0].font.size = Pt(10)
+            section_sub.runs[0].font.size = _PT_10
 
             section_marks = doc.add_paragraph()
             section_marks.alignment = WD_ALIGN_PARAGRAPH.CENTER
             section_marks.add_run(
                 f"({num_questions} × {marks_per_q} = {section_total_marks} marks)"
             ).italic = True
-            section_marks.runs[0].font.size = Pt(10)
+            section_marks.runs[0].font.size = _PT_10
 
             doc.add_paragraph()  # Empty line
 
             # Process questions
-            questions = section_data.get("questions", [])
-
             i = 0
-            while i < len(questions):
+            while i < num_questions:
                 question = questions[i]
+                diagram_key = (section_index, i)
                 overall_q_num += 1
                 questions_count += 1
 
-                q_text = question.get("question_text", "")
+                # Unpack the fields used below once per question
                 q_marks = question.get("marks", marks_per_q)
-                q_format = question.get("question_format", "")
-                has_choice = question.get("internal_choice", False)
-
-                # Handle internal choice questions (OR format)
-                if has_choice and section_id in ["B", "C", "D"] and i >= len(questions) - 2:
-                    # This is one of the last 2 questions with internal choice
-                    q_para = doc.add_paragraph()
-                    q_para.add_run(f"{overall_q_num}.").bold = True
-                    q_para.add_run(f" {q_text} ({q_marks} marks)")
-
-                    # Add OR
-                    or_para = doc.add_paragraph()
-                    or_para.add_run("OR").bold = True
-                    or_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    or_para.runs[0].font.size = Pt(10)
-
-                    # Next question is the alternative
-                    if i + 1 < len(questions):
+                is_mcq = question.get("question_format", "") == "MCQ"
+                q_options = question.get("options")
+
+                # Emit the question stem via the formatter for its layout kind
+                kind = _question_kind(question, section_id, i, num_questions)
+                _QUESTION_FORMATTERS[kind](question, doc, overall_q_num, q_marks)
+
+                # Internal choice (OR format): the next question is the alternative
+                if kind == _KIND_INTERNAL_CHOICE:
+                    if i + 1 < num_questions:
                         i += 1
                         alt_question = questions[i]
                         alt_q_text = alt_question.get("question_text", "")
                         alt_q_marks = alt_question.get("marks", q_marks)
+                        alt_options = alt_question.get("options")
 
                         alt_para = doc.add_paragraph()
                         alt_para.add_run(f"{alt_q_text} ({alt_q_marks} marks)")
 
                         # Handle options for alternative if MCQ
-                        if q_format == "MCQ" and alt_question.get("options"):
-                            _format_mcq_options(alt_question.get("options"), doc)
+                        if is_mcq and alt_options:
+                            _format_mcq_options(alt_options, doc)
 
                         # Handle diagram for alternative
-                        if alt_question.get("has_diagram"):
-                            svg_base64 = alt_question.get("diagram_svg_base64", "")
-                            if svg_base64:
-                                png_bytes = _svg_base64_to_png(svg_base64, width=350)
-                                if png_bytes:
-                                    temp_png = TEMP_DIR / f"_{uuid.uuid4()}.png"
-                                    with open(temp_png, "wb") as f:
-                                        f.write(png_bytes)
-                                    try:
-                                        diagram_para = doc.add_paragraph()
-                                        diagram_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                                        desc = alt_question.get("diagram_description", "Diagram")
-                                        diagram_para.add_run(f"Figure: {desc}").italic = True
-                                        doc.add_picture(str(temp_png), width=Inches(4))
-                                        diagrams_embedded += 1
-                                    finally:
-                                        temp_png.unlink()
+                        if _embed_diagram(
+                            doc, alt_question, diagram_futures.get((section_index, i))
+                        ):
+                            diagrams_embedded += 1
 
                         overall_q_num += 1
                         questions_count += 1
 
-                # Handle case study questions (Section E)
-                elif section_id == "E" or question.get("has_sub_questions"):
-                    overall_q_num = _format_case_study_question(
-                        question, doc, overall_q_num, q_marks
-                    )
-
-                    # Handle options if MCQ case study
-                    if q_format == "MCQ" and question.get("options"):
-                        _format_mcq_options(question.get("options"), doc)
-
-                # Handle normal questions
-                else:
-                    q_para = doc.add_paragraph()
-                    q_para.add_run(f"{overall_q_num}.").bold = True
-                    q_para.add_run(f" {q_text} ({q_marks} mark{'s' if q_marks > 1 else ''})")
-
-                    # Handle MCQ options (new dict format)
-                    if q_format == "MCQ" and question.get("options"):
-                        _format_mcq_options(question.get("options"), doc)
+                # Handle MCQ options (new dict format) for normal and case study questions
+                elif is_mcq and q_options:
+                    _format_mcq_options(q_options, doc)
 
                 # Embed diagram if present (for all question types)
-                if question.get("has_diagram") or question.get("diagram_needed"):
-                    svg_base64 = question.get("diagram_svg_base64", "")
-                    if svg_base64:
-                        png_bytes = _svg_base64_to_png(svg_base64, width=350)
-
-                        if png_bytes:
-                            temp_png = TEMP_DIR / f"_{uuid.uuid4()}.png"
-                            with open(temp_png, "wb") as f:
-                                f.write(png_bytes)
-
-                            try:
-                                diagram_para = doc.add_paragraph()
-                                diagram_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-                                desc = question.get("diagram_description", "Diagram")
-                                diagram_para.add_run(f"Figure: {desc}").italic = True
-
-                                doc.add_picture(str(temp_png), width=Inches(4))
-
-                                diagrams_embedded += 1
-                            finally:
-                                temp_png.unlink()
+                if _embed_diagram(doc, question, diagram_futures.get(diagram_key)):
+                    diagrams_embedded += 1
 
                 # Add answer space (for non-MCQ questions)
-                if q_format not in ["MCQ"] and not question.get("has_sub_questions"):
+                if not is_mcq and not question.get("has_sub_questions"):
                     # Add some space for answer
                     doc.add_paragraph()
 
                 i += 1
 
-            # Page break between sections
-            doc.add_page_break()
+            # Page break between sections (none after the last one, which would
+            # only leave a blank trailing page)
+            if section_index < last_section_index:
+                doc.add_page_break()
+
+        # Single timestamp shared by the footer, filename and result
+        generated_at = datetime.now()
+        footer_text = (
+            f"CBSE Question Paper Generator | Generated: {generated_at.strftime('%Y-%m-%d %H:%M')}"
+        )
 
         # Create footer
         for section in doc.sections:
             footer = section.footer
             footer_para = footer.paragraphs[0] if footer.paragraphs else footer.add_paragraph()
-            footer_para.text = f"CBSE Question Paper Generator | Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+            footer_para.text = footer_text
             footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            footer_para.runs[0].font.size = Pt(8)
-            footer_para.runs[0].font.color.rgb = RGBColor(128, 128, 128)
+            footer_para.runs[0].font.size = _PT_8
+            footer_para.runs[0].font.color.rgb = _GREY
 
         # Generate output filename
         if not output_docx_path:
-            output_docx_path = str(DOCX_OUTPUT_DIR / _generate_docx_filename(metadata))
+            output_docx_path = str(DOCX_OUTPUT_DIR / _generate_docx_filename(metadata, generated_at))
         else:
             output_docx_path = str(output_docx_path)
 
         # Ensure output directory exists
         Path(output_docx_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # Save document
-        doc.save(str(output_docx_path))
+        # Save document through a large write buffer (the zip writer issues many small writes)
+        with open(output_docx_path, "wb", buffering=DOCX_WRITE_BUFFER_SIZE) as out:
+            doc.save(out)
 
         return {
             "success": True,
             "docx_path": str(output_docx_path),
             "questions_count": questions_count,
             "diagrams_embedded": diagrams_embedded,
-            "generation_time": datetime.now().isoformat(),
+            "generation_time": generated_at.isoformat(),
         }
 
     except Exception as e:
@@ -516,7 +884,7 @@ def verify_docx_generator():
         print(f"✗ python-docx not available: {e}")
         return
 
-    if not _ensure_cairosvg_installed():
+    if not HAVE_CAIROSVG:
         print("⚠ cairosvg not available, SVG conversion will be skipped")
     else:
         print("✓ cairosvg available")
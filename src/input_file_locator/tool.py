@@ -5,10 +5,19 @@ from teacher input or auto-discover from the input/classes/ folder structure.
 """
 
 import os
+import re
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Iterator, Optional, Any
 from langchain_core.tools import tool
 
+# First whitespace-delimited token that is an input/ or output/ JSON path
+_EXPLICIT_PATH_RE = re.compile(r"(?<!\S)((?:input|output)/\S*\.json)(?!\S)")
+
+# Auto-discovery priorities (lower wins)
+_TEACHER_FILE = 0
+_MASTER_BLUEPRINT = 1
+_OTHER_JSON = 2
+
 
 @tool
 def locate_blueprint_tool(task: str) -> Dict[str, Any]:
@@ -42,16 +51,8 @@ def locate_blueprint_tool(task: str) -> Dict[str, Any]:
     classes_dir = Path("input/classes")
 
     # Step 1: Check for explicit path in task
-    words = task.split()
-    explicit_path = None
-
-    for word in words:
-        if word.startswith("input/") and word.endswith(".json"):
-            explicit_path = word
-            break
-        if word.startswith("output/") and word.endswith(".json"):
-            explicit_path = word
-            break
+    match = _EXPLICIT_PATH_RE.search(task)
+    explicit_path = match.group(1) if match else None
 
     # If explicit path found, validate and return
     if explicit_path:
@@ -95,10 +96,29 @@ def locate_blueprint_tool(task: str) -> Dict[str, Any]:
             "error": "Input classes directory not found. Expected: input/classes/",
         }
 
-    # Search for all JSON files in the classes directory
-    all_json_files = list(classes_dir.rglob("*.json"))
-
-    if not all_json_files:
+    # Single pass over input/classes/{class}/{subject}/*.json keeping only the best
+    # candidate so far. Priority 0: teacher input files (input_*.json) override
+    # master blueprints; priority 1: master blueprint.json files; priority 2: any
+    # other JSON file. Most recent wins within a priority. Candidates ranked below
+    # the current best are skipped without a stat() call.
+    best_priority = _OTHER_JSON + 1
+    best_mtime = 0.0
+    best_path = None
+    for entry in _scan_blueprint_candidates(str(classes_dir)):
+        name = entry.name
+        if name.startswith("input_"):
+            priority = _TEACHER_FILE
+        elif name == "blueprint.json":
+            priority = _MASTER_BLUEPRINT
+        else:
+            priority = _OTHER_JSON
+        if priority > best_priority:
+            continue
+        mtime = entry.stat().st_mtime
+        if priority < best_priority or mtime > best_mtime:
+            best_priority, best_mtime, best_path = priority, mtime, entry.path
+
+    if best_path is None:
         return {
             "file_path": None,
             "found": False,
@@ -109,26 +129,8 @@ def locate_blueprint_tool(task: str) -> Dict[str, Any]:
             "error": "No blueprint file found in input/classes/. Expected structure: input/classes/{class}/{subject}/blueprint.json or input/classes/{class}/{subject}/input_*.json",
         }
 
-    # Priority 1: Look for teacher input files (input_*.json) - these override master blueprints
-    teacher_files = [f for f in all_json_files if f.name.startswith("input_")]
-
-    # Priority 2: Look for master blueprint.json files
-    master_files = [f for f in all_json_files if f.name == "blueprint.json"]
-
-    # Select the most recent file based on priority
-    selected_file = None
-    is_teacher = False
-
-    if teacher_files:
-        selected_file = max(teacher_files, key=lambda f: f.stat().st_mtime)
-        is_teacher = True
-    elif master_files:
-        selected_file = max(master_files, key=lambda f: f.stat().st_mtime)
-        is_teacher = False
-    else:
-        # Fallback: use any JSON file found
-        selected_file = max(all_json_files, key=lambda f: f.stat().st_mtime)
-        is_teacher = selected_file.name.startswith("input_")
+    is_teacher = best_priority == _TEACHER_FILE
+    selected_file = Path(best_path)
 
     # Extract class and subject from path
     class_num, subject = _extract_class_subject(selected_file)
@@ -144,6 +146,34 @@ def locate_blueprint_tool(task: str) -> Dict[str, Any]:
     }
 
 
+def _scan_blueprint_candidates(classes_dir: str) -> Iterator[os.DirEntry]:
+    """
+    Yield JSON files exactly two levels below the classes directory.
+
+    Walks input/classes/{class}/{subject}/ with os.scandir, skipping anything that
+    is not a directory at the class and subject levels, so only the expected
+    layout is visited (no recursive glob over the whole tree).
+
+    Args:
+        classes_dir: Path to the input/classes directory
+
+    Yields:
+        DirEntry for each *.json file in a subject directory
+    """
+    with os.scandir(classes_dir) as class_entries:
+        for class_entry in class_entries:
+            if not class_entry.is_dir():
+                continue
+            with os.scandir(class_entry.path) as subject_entries:
+                for subject_entry in subject_entries:
+                    if not subject_entry.is_dir():
+                        continue
+                    with os.scandir(subject_entry.path) as file_entries:
+                        for file_entry in file_entries:
+                            if file_entry.name.endswith(".json") and file_entry.is_file():
+                                yield file_entry
+
+
 def _extract_class_subject(file_path: Path) -> tuple[Optional[int], Optional[str]]:
     """
     Extract class number and subject from the file path.
@@ -4,9 +4,9 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssembledQuestion:
-    """Represents a fully assembled CBSE question."""
+    """Represents a fully assembled CBSE question (immutable, slotted)."""
 
     question_id: str
     question_text: str
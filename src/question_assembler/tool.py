@@ -5,7 +5,11 @@ Supports both single question assembly and section compilation with CBSE format.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from functools import lru_cache
+from itertools import count
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from langchain_core.tools import tool
 
@@ -14,21 +18,24 @@ from cbse_question_retriever.data_types import (
     FORMAT_ABBREVIATIONS,
     SUBJECT_ABBREVIATIONS,
 )
-from diagram_generation.tool import generate_diagram_tool
 
 logger = logging.getLogger(__name__)
 
-# Global counter for sequential question numbering across sections
-_question_counter = 0
+# Global counter for sequential question numbering across sections (next() on an
+# itertools.count is atomic, so concurrent assemblies never share a number)
+_question_counter = count(1)
 
-# Keywords for diagram detection
+# Keywords for diagram detection (lowercase, immutable tuples). Keywords match whole
+# words (plus a plural suffix), so longer forms such as "sine" or "parallelogram" are
+# listed alongside the short keywords they start with.
 DIAGRAM_KEYWORDS = {
-    "geometric": [
+    "geometric": (
         "triangle",
         "circle",
         "quadrilateral",
         "polygon",
         "angle",
+        "rectangle",
         "∠",
         "vertex",
         "vertices",
@@ -42,12 +49,16 @@ DIAGRAM_KEYWORDS = {
         "pythagoras",
         "perpendicular",
         "parallel",
+        "parallelogram",
         "intersecting",
         "sin",
+        "sine",
         "cos",
+        "cosine",
         "tan",
         "cot",
         "sec",
+        "secant",
         "cosec",
         "elevation",
         "depression",
@@ -56,14 +67,16 @@ DIAGRAM_KEYWORDS = {
         "shadow",
         "ladder",
         "pole",
-    ],
-    "coordinate": [
+    ),
+    "coordinate": (
         "graph",
+        "graphical",
         "plot",
         "coordinate",
         "axis",
         "point",
         "line",
+        "linear",
         "slope",
         "intercept",
         "distance",
@@ -71,8 +84,8 @@ DIAGRAM_KEYWORDS = {
         "quadrant",
         "x-coordinate",
         "y-coordinate",
-    ],
-    "chart": [
+    ),
+    "chart": (
         "histogram",
         "bar chart",
         "pie chart",
@@ -82,21 +95,64 @@ DIAGRAM_KEYWORDS = {
         "data interpretation",
         "graph",
         "distribution",
-    ],
+    ),
 }
 
+# (priority, category, lowercased keyword) in detection precedence order: geometric,
+# then coordinate, then chart, list order within a category (lowest priority wins).
+# Keywords are lowercased once here so matching never calls str.lower() on them.
+_DIAGRAM_KEYWORD_ORDER = tuple(
+    (priority, category, keyword)
+    for priority, (category, keyword) in enumerate(
+        (category, keyword.lower())
+        for category, keywords in DIAGRAM_KEYWORDS.items()
+        for keyword in keywords
+    )
+)
+
+
+def _diagram_keyword_pattern(keyword: str) -> str:
+    """Regex for a lowercased keyword, allowing a plural suffix on word keywords.
+
+    The trailing boundary stops short keywords firing at the start of longer words
+    ("sec" in "second"); the leading one is added by _diagram_keyword_alternation.
+    """
+    pattern = re.escape(keyword)
+    if keyword[-1].isalnum():
+        pattern += r"(?:e?s)?(?!\w)"
+    return pattern
+
+
+def _diagram_keyword_alternation(word_start: bool) -> str:
+    """Named alternatives (k<priority>) for keywords that do / don't start with a letter."""
+    return "|".join(
+        f"(?P<k{priority}>{_diagram_keyword_pattern(keyword)})"
+        for priority, _, keyword in _DIAGRAM_KEYWORD_ORDER
+        if keyword[0].isalnum() == word_start
+    )
+
+
+# Every keyword in one regex, in precedence order. Word keywords must start a word
+# ("sin" not in "using", "side" not in "inside"); symbols such as "∠" match anywhere.
+# The lookahead makes every text position a candidate, so overlapping keywords are all
+# seen, and at each position the first alternative that matches is the
+# highest-precedence keyword there (word and symbol keywords never start at the same
+# position).
+_DIAGRAM_KEYWORD_RE = re.compile(
+    rf"(?=(?:(?<!\w)(?:{_diagram_keyword_alternation(True)})"
+    rf"|{_diagram_keyword_alternation(False)}))"
+)
+
 
 def reset_question_counter():
     """Reset counter for new paper generation."""
     global _question_counter
-    _question_counter = 0
+    _question_counter = count(1)
 
 
 def get_next_question_number() -> int:
     """Get next sequential question number (Q1, Q2, Q3...)."""
-    global _question_counter
-    _question_counter += 1
-    return _question_counter
+    return next(_question_counter)
 
 
 def detect_diagram_need(
@@ -116,34 +172,54 @@ def detect_diagram_need(
     Returns:
         Dictionary with diagram detection results
     """
-    text_lower = (question_text + " " + topic + " " + chapter).lower()
-
-    # Check for geometric keywords
-    for keyword in DIAGRAM_KEYWORDS["geometric"]:
-        if keyword.lower() in text_lower:
-            return {
-                "diagram_needed": True,
-                "diagram_type": "geometric",
-                "reason": f"Detected keyword: {keyword}",
-            }
-
-    # Check for coordinate keywords
-    for keyword in DIAGRAM_KEYWORDS["coordinate"]:
-        if keyword.lower() in text_lower:
-            return {
-                "diagram_needed": True,
-                "diagram_type": "coordinate",
-                "reason": f"Detected keyword: {keyword}",
-            }
-
-    # Check for chart keywords
-    for keyword in DIAGRAM_KEYWORDS["chart"]:
-        if keyword.lower() in text_lower:
-            return {
-                "diagram_needed": True,
-                "diagram_type": "chart",
-                "reason": f"Detected keyword: {keyword}",
-            }
+    return _diagram_detection(_match_diagram_keyword_in((question_text, topic, chapter)))
+
+
+def _match_diagram_keyword_in(texts: Iterable[str]) -> Optional[Tuple[int, str, str]]:
+    """Find the highest-precedence keyword across several texts, scanned one by one.
+
+    Scanning each text separately avoids building a joined copy. Keywords never span
+    two texts.
+    """
+    hits = [hit for hit in map(_match_diagram_text, filter(None, texts)) if hit is not None]
+    return min(hits, default=None)
+
+
+@lru_cache(maxsize=1024)
+def _match_diagram_text(text: str) -> Optional[Tuple[int, str, str]]:
+    """Find the highest-precedence keyword in one text (geometric > coordinate > chart).
+
+    Cached since topics and chapters repeat in a paper. Returns the immutable
+    (priority, category, keyword) hit, so cached results are safe to share; callers
+    build a fresh detection dict from it.
+    """
+    # lower() is unconditional: on ASCII text it is cheaper than an islower() check
+    best = None
+    for match in _DIAGRAM_KEYWORD_RE.finditer(text.lower()):
+        priority = int(match.lastgroup[1:])
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                # Nothing later in the text can outrank the first keyword
+                break
+    return None if best is None else _DIAGRAM_KEYWORD_ORDER[best]
+
+
+# Detection reason per keyword, built once instead of formatted on every match
+_DETECTED_KEYWORD_REASONS = {
+    keyword: f"Detected keyword: {keyword}" for _, _, keyword in _DIAGRAM_KEYWORD_ORDER
+}
+
+
+def _diagram_detection(match: Optional[Tuple[int, str, str]]) -> Dict[str, Any]:
+    """Build the diagram detection result for a keyword match (or no match)."""
+    if match is not None:
+        _, diagram_type, keyword = match
+        return {
+            "diagram_needed": True,
+            "diagram_type": diagram_type,
+            "reason": _DETECTED_KEYWORD_REASONS[keyword],
+        }
 
     return {
         "diagram_needed": False,
@@ -152,6 +228,46 @@ def detect_diagram_need(
     }
 
 
+# Chapter name (lowercased) -> abbreviation, for O(1) exact lookups
+_CHAPTER_EXACT = {name.lower(): abbr for name, abbr in CHAPTER_ABBREVIATIONS.items()}
+
+
+@lru_cache(maxsize=256)
+def _chapter_abbreviation(chapter: str) -> str:
+    """Resolve a chapter name to its question-ID abbreviation.
+
+    Exact names are a dict lookup; otherwise the first partial match in
+    CHAPTER_ABBREVIATIONS order is used, falling back to the first 3 letters of up
+    to 3 words. Results are cached since papers reuse a handful of chapters.
+    """
+    chapter_lower = chapter.lower()
+    chapter_abbr = _CHAPTER_EXACT.get(chapter_lower)
+    if chapter_abbr:
+        return chapter_abbr
+
+    # Find chapter abbreviation (handle partial matches)
+    for ch_name, ch_abbr in _CHAPTER_EXACT.items():
+        if ch_name in chapter_lower or chapter_lower in ch_name:
+            return ch_abbr
+
+    # Create abbreviation from first 3 letters of each word
+    words = chapter.split()
+    return "".join([w[:3].upper() for w in words[:3]])
+
+
+@lru_cache(maxsize=1024)
+def _question_id_prefix(subject: str, class_level: int, chapter: str, question_format: str) -> str:
+    """Build the SUBJECT-CLASS-CHAPTER-FORMAT part of a question ID (e.g. MATH-10-POL-MCQ).
+
+    Shared by every question number in a section, so it is memoized separately.
+    """
+    # Get abbreviations
+    subject_abbr = SUBJECT_ABBREVIATIONS.get(subject.lower(), subject[:4].upper())
+    chapter_abbr = _chapter_abbreviation(chapter)
+    format_abbr = FORMAT_ABBREVIATIONS.get(question_format.upper(), "UNK")
+    return f"{subject_abbr}-{class_level}-{chapter_abbr}-{format_abbr}"
+
+
 def generate_question_id(
     subject: str,
     class_level: int,
@@ -171,26 +287,62 @@ def generate_question_id(
     Returns:
         Formatted question ID
     """
-    # Get abbreviations
-    subject_abbr = SUBJECT_ABBREVIATIONS.get(subject.lower(), "UNK")
-    chapter_lower = chapter.lower()
-    chapter_abbr = None
+    # Format: MATH-10-POL-MCQ-001
+    prefix = _question_id_prefix(subject, class_level, chapter, question_format)
+    return f"{prefix}-{question_number:03d}"
+
+
+# Starting elements per diagram kind. Builders return a shallow copy, so callers get
+# their own top-level dict; the nested containers are shared and only ever read by the
+# diagram renderer and display code.
+_TRIANGLE_ELEMENTS: Dict[str, Any] = {
+    "shape": "triangle",
+    "points": ["A", "B", "C"],
+    "sides": [],
+    "angles": [],
+}
+_CIRCLE_ELEMENTS: Dict[str, Any] = {
+    "shape": "circle",
+    "center": (150, 150),
+    "radius": 60,
+}
+_COORDINATE_ELEMENTS: Dict[str, Any] = {
+    "coordinates": {},
+    "lines": [],
+}
+_CHART_ELEMENTS: Dict[str, Any] = {
+    "data": [],
+    "chart_type": "bar",
+}
 
-    # Find chapter abbreviation (handle partial matches)
-    for ch_name, ch_abbr in CHAPTER_ABBREVIATIONS.items():
-        if ch_name in chapter_lower or chapter_lower in ch_name:
-            chapter_abbr = ch_abbr
-            break
 
-    if not chapter_abbr:
-        # Create abbreviation from first 3 letters of each word
-        words = chapter.split()
-        chapter_abbr = "".join([w[:3].upper() for w in words[:3]])
+def _build_geometric_elements(question_text: str, topic: str) -> Optional[Dict[str, Any]]:
+    """Build elements for a geometric diagram (triangle or circle)."""
+    question_lower = question_text.lower()
+    # Check for triangle-related questions
+    if "triangle" in question_lower or "triangle" in topic.lower():
+        return _TRIANGLE_ELEMENTS.copy()
+    # Check for circle-related questions
+    if "circle" in question_lower:
+        return _CIRCLE_ELEMENTS.copy()
+    return None
 
-    format_abbr = FORMAT_ABBREVIATIONS.get(question_format, "UNK")
 
-    # Format: MATH-10-POL-MCQ-001
-    return f"{subject_abbr}-{class_level}-{chapter_abbr}-{format_abbr}-{question_number:03d}"
+def _build_coordinate_elements(question_text: str, topic: str) -> Optional[Dict[str, Any]]:
+    """Build elements for a coordinate-geometry diagram."""
+    return _COORDINATE_ELEMENTS.copy()
+
+
+def _build_chart_elements(question_text: str, topic: str) -> Optional[Dict[str, Any]]:
+    """Build elements for a chart diagram."""
+    return _CHART_ELEMENTS.copy()
+
+
+_DIAGRAM_ELEMENT_BUILDERS = {
+    "geometric": _build_geometric_elements,
+    "coordinate": _build_coordinate_elements,
+    "chart": _build_chart_elements,
+}
 
 
 def build_diagram_elements(
@@ -208,38 +360,39 @@ def build_diagram_elements(
     Returns:
         Diagram elements dictionary or None
     """
-    elements = {}
-
-    if diagram_type == "geometric":
-        # Check for triangle-related questions
-        if "triangle" in question_text.lower() or "triangle" in topic.lower():
-            elements = {
-                "shape": "triangle",
-                "points": ["A", "B", "C"],
-                "sides": [],
-                "angles": [],
-            }
-        # Check for circle-related questions
-        elif "circle" in question_text.lower():
-            elements = {
-                "shape": "circle",
-                "center": (150, 150),
-                "radius": 60,
-            }
-
-    elif diagram_type == "coordinate":
-        elements = {
-            "coordinates": {},
-            "lines": [],
-        }
+    builder = _DIAGRAM_ELEMENT_BUILDERS.get(diagram_type)
+    if builder is None:
+        return None
+    return builder(question_text, topic)
+
+
+def _llm_diagram_detection(
+    diagram_type: Optional[str], description: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """Diagram detection result from the LLM's own classification.
 
-    elif diagram_type == "chart":
-        elements = {
-            "data": [],
-            "chart_type": "bar",
+    Uses the LLM's diagram type when a builder exists for it, otherwise classifies the
+    LLM's diagram description by keyword.
+
+    Args:
+        diagram_type: Diagram type reported by the LLM, if any
+        description: Diagram description written by the LLM, if any
+
+    Returns:
+        Diagram detection result, or None when neither yields a supported type
+    """
+    if diagram_type in _DIAGRAM_ELEMENT_BUILDERS:
+        return {
+            "diagram_needed": True,
+            "diagram_type": diagram_type,
+            "reason": "LLM-provided",
         }
+    match = _match_diagram_text(description) if description else None
+    return _diagram_detection(match) if match is not None else None
 
-    return elements if elements else None
+
+# "X)" option prefixes, checked with one hash lookup on the first two characters
+_OPTION_PREFIXES = frozenset({"A)", "B)", "C)", "D)"})
 
 
 def convert_options_to_dict(options_raw) -> Dict[str, str]:
@@ -257,16 +410,29 @@ def convert_options_to_dict(options_raw) -> Dict[str, str]:
 
     if isinstance(options_raw, list):
         for opt in options_raw:
-            if opt and len(opt) > 2 and opt[0] in "ABCD" and opt[1] == ")":
-                key = opt[0]  # "A", "B", "C", or "D"
-                value = opt[2:].strip()  # Remove "X) " prefix
-                options[key] = value
+            if opt and len(opt) > 2 and opt[:2] in _OPTION_PREFIXES:
+                # "A", "B", "C", or "D" -> text without the "X) " prefix
+                options[opt[0]] = opt[2:].strip()
     elif isinstance(options_raw, dict):
         options = options_raw  # Already in correct format
 
     return options
 
 
+# Sub-parts of every Section E case study. Each question gets its own list, but the
+# part dicts are shared: they are only read (DOCX rendering, JSON output). Plain dicts
+# rather than MappingProxyType so the assembled paper stays JSON-serializable.
+_CASE_STUDY_SUB_QUESTIONS = (
+    {"part": "(i)", "marks": 1},
+    {"part": "(ii)", "marks": 1},
+    {"part": "(iii)", "marks": 2},
+)
+
+# Sections offering an "OR" alternative, and all sections with any internal choice
+_ALTERNATIVE_CHOICE_SECTIONS = frozenset({"B", "C", "D"})
+_CHOICE_SECTIONS = _ALTERNATIVE_CHOICE_SECTIONS | {"E"}
+
+
 def apply_cbse_internal_choice(questions: List[Dict], section_id: str) -> List[Dict]:
     """Apply CBSE internal choice rules to questions.
 
@@ -281,10 +447,14 @@ def apply_cbse_internal_choice(questions: List[Dict], section_id: str) -> List[D
     Returns:
         Updated questions with internal_choice flags
     """
+    # Section A (MCQs) and unknown sections have no internal choice
+    if section_id not in _CHOICE_SECTIONS:
+        return questions
+
     total_questions = len(questions)
 
     # Sections B, C, D: Choice in last 2 questions
-    if section_id in ["B", "C", "D"] and total_questions >= 2:
+    if section_id in _ALTERNATIVE_CHOICE_SECTIONS and total_questions >= 2:
         for i in range(total_questions - 2, total_questions):
             questions[i]["internal_choice"] = True
             questions[i]["choice_text"] = "OR"
@@ -294,11 +464,7 @@ def apply_cbse_internal_choice(questions: List[Dict], section_id: str) -> List[D
     elif section_id == "E":
         for q in questions:
             q["has_sub_questions"] = True
-            q["sub_questions"] = [
-                {"part": "(i)", "marks": 1},
-                {"part": "(ii)", "marks": 1},
-                {"part": "(iii)", "marks": 2},
-            ]
+            q["sub_questions"] = list(_CASE_STUDY_SUB_QUESTIONS)
             q["internal_choice"] = True
             q["choice_text"] = "Case Study based question"
 
@@ -330,12 +496,28 @@ def compile_section(
     Returns:
         CBSE-formatted section dictionary
     """
-    total_questions = len(questions)
-    section_total_marks = total_questions * marks_per_question
+    shell = _section_shell(
+        section_id, section_title, marks_per_question, question_format, len(questions)
+    )
 
     # Apply CBSE internal choice rules
-    questions = apply_cbse_internal_choice(questions, section_id)
+    return {**shell, "questions": apply_cbse_internal_choice(questions, section_id)}
+
 
+@lru_cache(maxsize=64)
+def _section_shell(
+    section_id: str,
+    section_title: str,
+    marks_per_question: int,
+    question_format: str,
+    total_questions: int,
+) -> Dict[str, Any]:
+    """Section metadata, which depends only on the scalar section parameters.
+
+    Memoized because papers and previews compile the same section shapes repeatedly.
+    The cached dict is never handed out: compile_section copies it and fills in the
+    questions (the None placeholder keeps "questions" in its usual key position).
+    """
     return {
         "section_id": section_id,
         "title": section_title,
@@ -343,13 +525,133 @@ def compile_section(
         "marks_per_question": marks_per_question,
         "questions_provided": total_questions,
         "questions_attempt": total_questions,  # CBSE: all compulsory
-        "section_total_marks": section_total_marks,
-        "questions": questions,
-        "internal_choice_available": section_id in ["B", "C", "D", "E"],
+        "section_total_marks": total_questions * marks_per_question,
+        "questions": None,
+        "internal_choice_available": section_id in _CHOICE_SECTIONS,
         "cbse_format": True,
     }
 
 
+# Defaults for the scalar fields read from retrieval and LLM results; merged with
+# the result in one step instead of one .get() per field (mutable defaults such as
+# metadata dicts are still created per call)
+_RETRIEVAL_DEFAULTS = {
+    "chapter": "",
+    "topic": "",
+    "question_format": "MCQ",
+    "marks": 1,
+    "difficulty": "medium",
+    "bloom_level": "understand",
+    "nature": "NUMERICAL",
+    "question_id": "",
+}
+_LLM_DEFAULTS = {
+    "question_text": "",
+    "options": None,
+    "correct_answer": None,
+    "explanation": None,
+    "diagram_needed": False,
+    "diagram_description": None,
+    "diagram_type": None,
+}
+
+
+# Read-only default for metadata that is only spread into a new dict, so a missing
+# entry does not allocate an empty dict. Never store it in a result: mappingproxy
+# objects are not JSON-serializable.
+_NO_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+# Field order and constant values of a failed question; mutable containers
+# (options, sub_questions) are always overridden with fresh objects.
+_EMPTY_QUESTION_SKELETON: Dict[str, Any] = {
+    "question_id": "",
+    "question_text": "",
+    "section_id": "",
+    "question_number": 0,
+    "chapter": "",
+    "topic": "",
+    "question_format": "MCQ",
+    "marks": 1,
+    "options": None,
+    "correct_answer": None,
+    "difficulty": "medium",
+    "bloom_level": "understand",
+    "nature": "NUMERICAL",
+    "has_diagram": False,
+    "diagram_type": None,
+    "diagram_svg_base64": None,
+    "diagram_description": None,
+    "diagram_elements": None,
+    "explanation": None,
+    "internal_choice": False,
+    "choice_text": None,
+    "has_sub_questions": False,
+    "sub_questions": None,
+    "generation_metadata": None,
+    "status": "failed",
+    "error": None,
+    "error_phase": None,
+}
+
+
+def _make_error_question(
+    retrieval_result: Dict[str, Any],
+    question_number: int,
+    *,
+    question_id: str,
+    question_text: str,
+    explanation: Optional[str],
+    error: str,
+    error_phase: str,
+    generation_metadata: Dict[str, Any],
+    default_difficulty: str = "medium",
+    default_bloom_level: str = "understand",
+    default_nature: str = "NUMERICAL",
+) -> Dict[str, Any]:
+    """Build a failed-question placeholder with the same shape as an assembled question.
+
+    Blueprint context (chapter, topic, format, marks, ...) comes from the retrieval
+    result; everything content-related is blank so the paper keeps its slot.
+
+    Args:
+        retrieval_result: Result from generate_question_tool
+        question_number: Question number within section (1-based)
+        question_id: ID to report for the failed question
+        question_text: Placeholder text describing the failure
+        explanation: Explanation text, if any
+        error: Error message
+        error_phase: Phase that failed (retrieval, llm, assembly, ...)
+        generation_metadata: Error metadata for the question
+        default_difficulty: Difficulty when the retrieval result has none
+        default_bloom_level: Bloom level when the retrieval result has none
+        default_nature: Nature when the retrieval result has none
+
+    Returns:
+        Error question dictionary with status "failed"
+    """
+    return {
+        **_EMPTY_QUESTION_SKELETON,
+        "question_id": question_id,
+        "question_text": question_text,
+        "section_id": retrieval_result.get("blueprint_reference", {}).get("section_id", ""),
+        "question_number": question_number,
+        "chapter": retrieval_result.get("chapter", ""),
+        "topic": retrieval_result.get("topic", ""),
+        "question_format": retrieval_result.get("question_format", "MCQ"),
+        "marks": retrieval_result.get("marks", 1),
+        "options": {},
+        "difficulty": retrieval_result.get("difficulty", default_difficulty),
+        "bloom_level": retrieval_result.get("bloom_level", default_bloom_level),
+        "nature": retrieval_result.get("nature", default_nature),
+        "explanation": explanation,
+        "sub_questions": [],
+        "generation_metadata": generation_metadata,
+        "error": error,
+        "error_phase": error_phase,
+    }
+
+
 @tool
 def assemble_question_tool(
     retrieval_result: Dict[str, Any],
@@ -382,6 +684,8 @@ def assemble_question_tool(
             - explanation: Solution explanation
             - diagram_needed: Boolean from LLM
             - diagram_description: Diagram description from LLM
+            - diagram_type: Diagram type from LLM (optional; a supported type skips
+              keyword detection)
 
         question_number: Question number within section (1-based)
 
@@ -433,50 +737,34 @@ def assemble_question_tool(
         retrieval_error = retrieval_result.get("error")
         if retrieval_error:
             logger.warning(f"Creating error question due to retrieval failure: {retrieval_error}")
-            question_id = retrieval_result.get("question_id", f"ERR-{question_number}")
-            return {
-                "question_id": question_id,
-                "question_text": f"[RETRIEVAL ERROR: {retrieval_error}]",
-                "section_id": retrieval_result.get("blueprint_reference", {}).get("section_id", ""),
-                "question_number": question_number,
-                "chapter": retrieval_result.get("chapter", ""),
-                "topic": retrieval_result.get("topic", ""),
-                "question_format": retrieval_result.get("question_format", "MCQ"),
-                "marks": retrieval_result.get("marks", 1),
-                "options": {},
-                "correct_answer": None,
-                "difficulty": retrieval_result.get("difficulty", ""),
-                "bloom_level": retrieval_result.get("bloom_level", ""),
-                "nature": retrieval_result.get("nature", ""),
-                "has_diagram": False,
-                "diagram_type": None,
-                "diagram_svg_base64": None,
-                "diagram_description": None,
-                "diagram_elements": None,
-                "explanation": None,
-                "internal_choice": False,
-                "choice_text": None,
-                "has_sub_questions": False,
-                "sub_questions": [],
-                "generation_metadata": {
+            return _make_error_question(
+                retrieval_result,
+                question_number,
+                question_id=retrieval_result.get("question_id", f"ERR-{question_number}"),
+                question_text=f"[RETRIEVAL ERROR: {retrieval_error}]",
+                explanation=None,
+                error=retrieval_error,
+                error_phase="retrieval",
+                generation_metadata={
                     "error": True,
                     "error_phase": "retrieval",
                     "error_message": retrieval_error,
                     "retrieval_metadata": retrieval_result.get("retrieval_metadata", {}),
                 },
-                "status": "failed",
-                "error": retrieval_error,
-                "error_phase": "retrieval",
-            }
-
-        # Extract blueprint context from retrieval result
-        chapter = retrieval_result.get("chapter", "")
-        topic = retrieval_result.get("topic", "")
-        question_format = retrieval_result.get("question_format", "MCQ")
-        marks = retrieval_result.get("marks", 1)
-        difficulty = retrieval_result.get("difficulty", "medium")
-        bloom_level = retrieval_result.get("bloom_level", "understand")
-        nature = retrieval_result.get("nature", "NUMERICAL")
+                default_difficulty="",
+                default_bloom_level="",
+                default_nature="",
+            )
+
+        # Extract blueprint context from retrieval result (defaults merged in one step)
+        retrieval = _RETRIEVAL_DEFAULTS | retrieval_result
+        chapter = retrieval["chapter"]
+        topic = retrieval["topic"]
+        question_format = retrieval["question_format"]
+        marks = retrieval["marks"]
+        difficulty = retrieval["difficulty"]
+        bloom_level = retrieval["bloom_level"]
+        nature = retrieval["nature"]
 
         # Get class and subject from blueprint reference
         blueprint_ref = retrieval_result.get("blueprint_reference", {})
@@ -484,7 +772,7 @@ def assemble_question_tool(
         subject = blueprint_ref.get("subject", "Mathematics")
 
         # Generate question ID if not provided
-        question_id = retrieval_result.get("question_id", "")
+        question_id = retrieval["question_id"]
         if not question_id:
             question_id = generate_question_id(
                 subject=subject,
@@ -498,62 +786,54 @@ def assemble_question_tool(
         llm_error = llm_result.get("error")
         if llm_error:
             logger.warning(f"Creating error question due to LLM failure: {llm_error}")
-            return {
-                "question_id": question_id,
-                "question_text": f"[LLM ERROR: {llm_error}]",
-                "section_id": blueprint_ref.get("section_id", ""),
-                "question_number": question_number,
-                "chapter": chapter,
-                "topic": topic,
-                "question_format": question_format,
-                "marks": marks,
-                "options": {},
-                "correct_answer": None,
-                "difficulty": difficulty,
-                "bloom_level": bloom_level,
-                "nature": nature,
-                "has_diagram": False,
-                "diagram_type": None,
-                "diagram_svg_base64": None,
-                "diagram_description": None,
-                "diagram_elements": None,
-                "explanation": f"Error during generation: {llm_error}",
-                "internal_choice": False,
-                "choice_text": None,
-                "has_sub_questions": False,
-                "sub_questions": [],
-                "generation_metadata": {
+            error_phase = llm_result.get("error_phase", "llm")
+            return _make_error_question(
+                retrieval_result,
+                question_number,
+                question_id=question_id,
+                question_text=f"[LLM ERROR: {llm_error}]",
+                explanation=f"Error during generation: {llm_error}",
+                error=llm_error,
+                error_phase=error_phase,
+                generation_metadata={
                     "error": True,
-                    "error_phase": llm_result.get("error_phase", "llm"),
+                    "error_phase": error_phase,
                     "error_message": llm_error,
                     "retrieval_metadata": retrieval_result.get("retrieval_metadata", {}),
                     "llm_metadata": llm_result.get("generation_metadata", {}),
                 },
-                "status": "failed",
-                "error": llm_error,
-                "error_phase": llm_result.get("error_phase", "llm"),
-            }
+            )
 
         # Extract LLM-generated content
-        question_text = llm_result.get("question_text", "")
+        llm = _LLM_DEFAULTS | llm_result
+        question_text = llm["question_text"]
 
         # Convert options to dict format (handles both array and dict input)
-        options_raw = llm_result.get("options")
+        options_raw = llm["options"]
         options = convert_options_to_dict(options_raw)
 
-        correct_answer = llm_result.get("correct_answer")
-        explanation = llm_result.get("explanation")
+        correct_answer = llm["correct_answer"]
+        explanation = llm["explanation"]
 
         # Detect diagram need (use LLM result if available, otherwise detect)
-        llm_diagram_needed = llm_result.get("diagram_needed", False)
-        llm_diagram_desc = llm_result.get("diagram_description")
-
-        detection_result = detect_diagram_need(
-            question_text=question_text,
-            topic=topic,
-            chapter=chapter,
-            question_format=question_format,
+        llm_diagram_needed = llm["diagram_needed"]
+        llm_diagram_desc = llm["diagram_description"]
+        llm_diagram_type = llm["diagram_type"]
+
+        # When the LLM already asked for a diagram, its own type or description usually
+        # settles the diagram type without scanning the question
+        detection_result = (
+            _llm_diagram_detection(llm_diagram_type, llm_diagram_desc)
+            if llm_diagram_needed
+            else None
         )
+        if detection_result is None:
+            detection_result = detect_diagram_need(
+                question_text=question_text,
+                topic=topic,
+                chapter=chapter,
+                question_format=question_format,
+            )
 
         # Combine LLM and rule-based detection (LLM takes precedence if True)
         has_diagram = llm_diagram_needed or detection_result["diagram_needed"]
@@ -573,8 +853,11 @@ def assemble_question_tool(
                 topic=topic,
             )
 
-            # Call diagram generation tool
+            # Call diagram generation tool (imported here so assembling questions
+            # without diagrams never loads the SVG rendering stack)
             try:
+                from diagram_generation.tool import generate_diagram_tool
+
                 diagram_result = generate_diagram_tool.invoke(
                     {
                         "diagram_description": diagram_description,
@@ -599,7 +882,7 @@ def assemble_question_tool(
 
         # Combine generation metadata
         generation_metadata = {
-            **llm_result.get("generation_metadata", {}),
+            **llm_result.get("generation_metadata", _NO_METADATA),
             "retrieval_metadata": retrieval_result.get("retrieval_metadata", {}),
             "diagram_detection": detection_result,
             "diagram_generated": has_diagram and diagram_svg_base64 is not None,
@@ -654,35 +937,17 @@ def assemble_question_tool(
 
     except Exception as e:
         logger.exception(f"Error assembling question: {e}")
-        return {
-            "question_id": retrieval_result.get("question_id", f"ERR-{question_number}"),
-            "question_text": f"[Error: Could not assemble question - {str(e)}]",
-            "section_id": retrieval_result.get("blueprint_reference", {}).get("section_id", ""),
-            "question_number": question_number,
-            "chapter": retrieval_result.get("chapter", ""),
-            "topic": retrieval_result.get("topic", ""),
-            "question_format": retrieval_result.get("question_format", "MCQ"),
-            "marks": retrieval_result.get("marks", 1),
-            "options": {},
-            "correct_answer": None,
-            "difficulty": retrieval_result.get("difficulty", "medium"),
-            "bloom_level": retrieval_result.get("bloom_level", "understand"),
-            "nature": retrieval_result.get("nature", "NUMERICAL"),
-            "has_diagram": False,
-            "diagram_type": None,
-            "diagram_svg_base64": None,
-            "diagram_description": None,
-            "diagram_elements": None,
-            "explanation": f"Assembly error: {str(e)}",
-            "internal_choice": False,
-            "choice_text": None,
-            "has_sub_questions": False,
-            "sub_questions": [],
-            "generation_metadata": {"error": True, "error_message": str(e)},
-            "status": "failed",
-            "error": str(e),
-            "error_phase": "assembly",
-        }
+        error_message = str(e)
+        return _make_error_question(
+            retrieval_result,
+            question_number,
+            question_id=retrieval_result.get("question_id", f"ERR-{question_number}"),
+            question_text=f"[Error: Could not assemble question - {error_message}]",
+            explanation=f"Assembly error: {error_message}",
+            error=error_message,
+            error_phase="assembly",
+            generation_metadata={"error": True, "error_message": error_message},
+        )
 
 
 @tool
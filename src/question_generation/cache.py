@@ -0,0 +1,241 @@
+"""Persistent cache of generated questions.
+
+Generating a question is an LLM round trip, and the same requirements (chapter,
+topic, format, difficulty, ...) recur across papers built from the same blueprint.
+QuestionCache stores each generated question in SQLite keyed on its requirements so
+later papers can reuse it instead of generating it again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Cache database location, in the user's cache directory rather than the source tree
+CACHE_DB_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "cbse-question-paper-generator"
+    / "question_cache.db"
+)
+
+# Recently used questions kept in memory in front of SQLite
+MEMORY_CACHE_SIZE = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS question_cache (
+    cache_key TEXT PRIMARY KEY,
+    blueprint_hash TEXT,
+    question_data TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    used_count INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+# Applied to the cache's long-lived connection. WAL with synchronous=NORMAL commits
+# without an fsync per write; a crash can lose only the last few cached questions.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def make_cache_key(requirements: Any, occurrence: int = 0) -> str:
+    """Build a stable cache key for a question's requirements.
+
+    Args:
+        requirements: QuestionRequirements dataclass instance
+        occurrence: How many earlier questions in the same paper share these
+            requirements; keeps repeated requirements from reusing one question
+
+    Returns:
+        Hex digest identifying the requirements
+    """
+    payload = json.dumps(asdict(requirements), sort_keys=True)
+    return hashlib.sha256(f"{payload}#{occurrence}".encode("utf-8")).hexdigest()
+
+
+def hash_blueprint(blueprint_bytes: bytes) -> str:
+    """Hash a blueprint file's raw contents, recorded with every cached question.
+
+    Args:
+        blueprint_bytes: Contents of the blueprint JSON file
+
+    Returns:
+        Hex digest of the contents
+    """
+    return hashlib.sha256(blueprint_bytes).hexdigest()
+
+
+class QuestionCache:
+    """SQLite-backed store of generated questions keyed on their requirements.
+
+    One connection is kept open for the cache's lifetime and shared across threads
+    under a lock. Recently used entries are also kept in an in-memory LRU, so repeated
+    lookups skip SQLite. Hit counts (used_count) are buffered and written by flush().
+    Entries older than the TTL are treated as misses and purged when the cache is opened.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = CACHE_DB_PATH,
+        memory_size: int = MEMORY_CACHE_SIZE,
+        ttl: Optional[timedelta] = None,
+    ):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            db_path: Path to the SQLite database file
+            memory_size: Number of entries kept in the in-memory LRU
+            ttl: How long a cached question stays reusable; None keeps entries forever
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        self._conn.execute(_SCHEMA)
+        self._lock = threading.Lock()
+        self.memory_size = memory_size
+        self.ttl = ttl
+        # cache_key -> (serialized question, created_at); JSON text so every hit gets
+        # its own dict
+        self._memory: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._pending_hits: List[str] = []
+
+        cutoff = self._expiry_cutoff()
+        if cutoff is not None:
+            self._conn.execute("DELETE FROM question_cache WHERE created_at < ?", (cutoff,))
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements as one transaction (caller holds the lock)."""
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached question.
+
+        Args:
+            cache_key: Key from make_cache_key
+
+        Returns:
+            The cached question dictionary, or None on a miss or an expired entry
+        """
+        cutoff = self._expiry_cutoff()
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                self._memory.move_to_end(cache_key)
+            else:
+                entry = self._conn.execute(
+                    "SELECT question_data, created_at FROM question_cache WHERE cache_key = ?",
+                    (cache_key,),
+                ).fetchone()
+                if entry is None:
+                    return None
+                self._remember(cache_key, *entry)
+            question_data, created_at = entry
+            if cutoff is not None and created_at < cutoff:
+                return None
+            self._pending_hits.append(cache_key)
+
+        return json.loads(question_data)
+
+    def set(
+        self,
+        cache_key: str,
+        question: Dict[str, Any],
+        blueprint_hash: Optional[str] = None,
+    ) -> None:
+        """Store a generated question, replacing any earlier entry for the key.
+
+        Args:
+            cache_key: Key from make_cache_key
+            question: Generated question dictionary
+            blueprint_hash: Hash of the blueprint the question was generated for
+        """
+        question_data = json.dumps(question)
+        created_at = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO question_cache "
+                "(cache_key, blueprint_hash, question_data, created_at) VALUES (?, ?, ?, ?)",
+                (cache_key, blueprint_hash, question_data, created_at),
+            )
+            self._remember(cache_key, question_data, created_at)
+
+    def set_many(self, writes: Sequence[Tuple[str, Optional[str], str]]) -> None:
+        """Store several serialized questions in one transaction.
+
+        Args:
+            writes: (cache_key, blueprint_hash, question JSON) per question
+        """
+        if not writes:
+            return
+        created_at = datetime.now().isoformat()
+        with self._lock:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO question_cache "
+                    "(cache_key, blueprint_hash, question_data, created_at) VALUES (?, ?, ?, ?)",
+                    [
+                        (cache_key, blueprint_hash, question_data, created_at)
+                        for cache_key, blueprint_hash, question_data in writes
+                    ],
+                )
+            for cache_key, _, question_data in writes:
+                self._remember(cache_key, question_data, created_at)
+
+    def flush(self) -> None:
+        """Write buffered hit counts to the database in one transaction."""
+        with self._lock:
+            if not self._pending_hits:
+                return
+            hits, self._pending_hits = self._pending_hits, []
+            with self._transaction() as conn:
+                conn.executemany(
+                    "UPDATE question_cache SET used_count = used_count + 1 WHERE cache_key = ?",
+                    [(cache_key,) for cache_key in hits],
+                )
+
+    def clear(self) -> None:
+        """Remove every cached question."""
+        with self._lock:
+            self._conn.execute("DELETE FROM question_cache")
+            self._memory.clear()
+            self._pending_hits.clear()
+
+    def close(self) -> None:
+        """Write any buffered hit counts and close the database connection."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def _expiry_cutoff(self) -> Optional[str]:
+        """Return the created_at below which entries have expired, or None without a TTL."""
+        if self.ttl is None:
+            return None
+        return (datetime.now() - self.ttl).isoformat()
+
+    def _remember(self, cache_key: str, question_data: str, created_at: str) -> None:
+        """Add an entry to the in-memory LRU, evicting the least recently used."""
+        self._memory[cache_key] = (question_data, created_at)
+        self._memory.move_to_end(cache_key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
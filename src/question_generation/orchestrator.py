@@ -10,13 +10,86 @@ Direct question generation logic will be moved to the subagent.
 
 import asyncio
 import json
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import cycle, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass
 
 from langchain_core.tools import tool
 
+from question_assembler.tool import generate_question_id
+
+from .cache import QuestionCache, hash_blueprint, make_cache_key
+from .settings import settings
+
+if TYPE_CHECKING:
+    from .question_bank import QuestionBank
+
+# orjson serializes papers (base64 SVG payloads) much faster; stdlib json is the fallback
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _dump_json(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _dump_json(value: Any) -> bytes:
+        return json.dumps(value, indent=2).encode("utf-8")
+
+
+# uvloop (libuv-backed event loop) speeds up the I/O-bound generation loop; optional, and
+# unavailable on Windows, where the default asyncio loop is used
+try:
+    import uvloop
+
+    _EVENT_LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    _EVENT_LOOP_FACTORY = None
+
+# Container levels of the paper written one element at a time:
+# paper -> sections -> section -> questions. Each question is serialized on its own.
+_PAPER_STREAM_DEPTH = 4
+
+
+def _write_json_streamed(f: BinaryIO, value: Any, depth: int, level: int = 0) -> None:
+    """Write value as 2-space indented JSON, serializing nested containers piecewise.
+
+    Produces the same bytes as serializing value in one call, but containers down to
+    depth levels are written element by element, so only one element's encoding is
+    held in memory at a time.
+
+    Args:
+        f: Binary file to write to
+        value: JSON-serializable value
+        depth: How many container levels to stream before serializing whole values
+        level: Current indentation level
+    """
+    if depth == 0 or not isinstance(value, (dict, list)) or not value:
+        f.write(_dump_json(value).replace(b"\n", b"\n" + b"  " * level))
+        return
+
+    item_prefix = b"\n" + b"  " * (level + 1)
+    if isinstance(value, dict):
+        f.write(b"{")
+        for index, (key, item) in enumerate(value.items()):
+            f.write((b"," if index else b"") + item_prefix + _dump_json(str(key)) + b": ")
+            _write_json_streamed(f, item, depth - 1, level + 1)
+        f.write(b"\n" + b"  " * level + b"}")
+    else:
+        f.write(b"[")
+        for index, item in enumerate(value):
+            f.write((b"," if index else b"") + item_prefix)
+            _write_json_streamed(f, item, depth - 1, level + 1)
+        f.write(b"\n" + b"  " * level + b"]")
+
+
 # =============================================================================
 # TAVILY SEARCH INTEGRATION - DISABLED
 # =============================================================================
@@ -49,10 +122,15 @@ from langchain_core.tools import tool
 RATE_LIMIT_PER_MINUTE = 100
 MAX_CONCURRENT = 15
 
+# Lowercases ASCII letters and turns spaces into dashes in a single translate pass
+_TAG_TRANSLATION = str.maketrans(
+    {**{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}, " ": "-"}
+)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuestionRequirements:
-    """Requirements for a single question."""
+    """Requirements for a single question (immutable and hashable)."""
 
     class_level: int
     subject: str
@@ -65,6 +143,52 @@ class QuestionRequirements:
     cognitive_level: str
 
 
+@dataclass(slots=True, frozen=True)
+class _BlueprintSection:
+    """A blueprint section, with the defaults applied to missing fields."""
+
+    section_id: str
+    section_title: str
+    questions_provided: int
+    marks_per_question: int
+    question_format: str
+    topic_focus: Sequence[str]
+    allowed_question_natures: Sequence[str]
+    cognitive_level_hint: Sequence[str]
+
+    @classmethod
+    def from_dict(cls, section: Dict[str, Any]) -> "_BlueprintSection":
+        """Convert a section from blueprint JSON."""
+        return cls(
+            section_id=section.get("section_id", ""),
+            section_title=section.get("section_title", ""),
+            questions_provided=section.get("questions_provided", 0),
+            marks_per_question=section.get("marks_per_question", 0),
+            question_format=section.get("question_format", "MCQ"),
+            topic_focus=_as_tuple(section.get("topic_focus", [])),
+            allowed_question_natures=_as_tuple(
+                section.get("allowed_question_natures", ["NUMERICAL"])
+            ),
+            cognitive_level_hint=_as_tuple(section.get("cognitive_level_hint", [])),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class _LoadedBlueprint:
+    """A parsed blueprint and the lookups derived from it."""
+
+    blueprint: Dict[str, Any]  # shared between calls; must not be modified
+    blueprint_hash: str
+    sections: Tuple[_BlueprintSection, ...]
+    topic_to_chapter: Dict[str, str]
+    all_topics_chapter: str  # chapter for topics not in topic_to_chapter
+
+
+def _as_tuple(values: Any) -> Any:
+    """Freeze a JSON list into a tuple; other values (e.g. null) are kept as-is."""
+    return tuple(values) if isinstance(values, list) else values
+
+
 # =============================================================================
 # TAVILY CLIENT FUNCTION - DISABLED
 # =============================================================================
@@ -80,10 +204,6 @@ class QuestionRequirements:
 # =============================================================================
 
 
-# Semaphore for rate limiting
-request_semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-
-
 async def _optimize_query(requirements: QuestionRequirements) -> str:
     """Use query-optimizer subagent to generate search query."""
     # This would be called via the task() tool in practice
@@ -133,11 +253,7 @@ async def _assemble_question(
 ) -> Dict:
     """Use question-assembler subagent to create question."""
     # Generate question ID
-    chapter_abbr = _get_chapter_abbreviation(requirements.chapter)
-    format_abbr = _get_format_abbreviation(requirements.question_format)
-    question_id = (
-        f"MATH-{requirements.class_level}-{chapter_abbr}-{format_abbr}-{question_number:03d}"
-    )
+    question_id = _build_question_id(requirements, question_number)
 
     # This would use the subagent in practice
     # For now, create a basic structure
@@ -159,8 +275,8 @@ async def _assemble_question(
         "diagram_description": None,
         "diagram_elements": None,
         "tags": [
-            requirements.chapter.lower().replace(" ", "-"),
-            requirements.topic.lower().replace(" ", "-"),
+            _tag_slug(requirements.chapter),
+            _tag_slug(requirements.topic),
             requirements.nature.lower(),
         ],
     }
@@ -173,51 +289,237 @@ async def _assemble_question(
     return question
 
 
-def _get_chapter_abbreviation(chapter: str) -> str:
-    """Get chapter abbreviation for question ID."""
-    mapping = {
-        "real numbers": "REA",
-        "polynomials": "POL",
-        "linear equations": "LIN",
-        "quadratic equations": "QUAD",
-        "arithmetic progressions": "AP",
-        "coordinate geometry": "COG",
-        "triangles": "TRI",
-        "circles": "CIR",
-        "mensuration": "MEN",
-        "statistics": "STA",
-        "probability": "PRO",
-    }
-    return mapping.get(chapter.lower(), "GEN")
+def _tag_slug(text: str) -> str:
+    """Convert a chapter/topic name to a lowercase, dash-separated tag."""
+    if text.isascii():
+        return text.translate(_TAG_TRANSLATION)
+    return text.lower().replace(" ", "-")
 
 
-def _get_format_abbreviation(format_str: str) -> str:
-    """Get format abbreviation for question ID."""
-    mapping = {
-        "mcq": "MCQ",
-        "very_short": "VSQ",
-        "short": "SA",
-        "long": "LA",
-        "case_study": "CS",
-    }
-    return mapping.get(format_str.lower(), "UNK")
+def _build_question_id(requirements: QuestionRequirements, question_number: int) -> str:
+    """Build the question ID for a question's requirements and number.
+
+    Uses the question assembler's generate_question_id, so papers and assembled
+    questions share one ID format.
+    """
+    return generate_question_id(
+        requirements.subject,
+        requirements.class_level,
+        requirements.chapter,
+        requirements.question_format,
+        question_number,
+    )
+
+
+class _TokenBucket:
+    """Async token bucket: at most `rate` acquisitions per `period` seconds.
+
+    Starts full, so bursts of up to `rate` go through immediately; after that, callers
+    wait in FIFO order for tokens to refill. Like asyncio.Semaphore it must be created
+    inside the event loop that uses it.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._fill_rate = rate / period
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._fill_rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
 
 
 async def _generate_single_question(
     requirements: QuestionRequirements,
     question_number: int,
+    cache: Optional[QuestionCache] = None,
+    cache_key: Optional[str] = None,
+    blueprint_hash: Optional[str] = None,
+    rate_limiter: Optional[_TokenBucket] = None,
+    bank: Optional["QuestionBank"] = None,
+    pending_writes: Optional[List[Tuple[str, Optional[str], str]]] = None,
 ) -> Dict:
-    """Generate a single question."""
+    """Generate a single question, reusing a cached or banked one when available.
+
+    Only questions that are actually generated take a rate_limiter token; cache hits
+    make no API calls. New questions are not written to the cache here: they are
+    appended to pending_writes for the caller to store in one transaction.
+    """
+    if cache is not None and cache_key is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            # Same requirements as an earlier paper; only the numbering differs
+            cached["question_id"] = _build_question_id(requirements, question_number)
+            return cached
+
+    if bank is not None:
+        banked = await asyncio.to_thread(bank.take, requirements)
+        if banked is not None:
+            # Similar question from an earlier paper; renumber it for this one
+            banked["question_id"] = _build_question_id(requirements, question_number)
+            if pending_writes is not None and cache_key is not None:
+                pending_writes.append((cache_key, blueprint_hash, json.dumps(banked)))
+            return banked
+
+    if rate_limiter is not None:
+        await rate_limiter.acquire()
+
     # TEMPORARY: This function should delegate to cbse-question-retriever subagent
     # For now, generate a placeholder question
     question = await _assemble_question([], requirements, question_number)
+
+    if pending_writes is not None and cache_key is not None:
+        pending_writes.append((cache_key, blueprint_hash, json.dumps(question)))
     return question
 
 
+async def _generate_questions(
+    jobs: List[Tuple[QuestionRequirements, int, str]],
+    cache: Optional[QuestionCache] = None,
+    blueprint_hash: Optional[str] = None,
+    bank: Optional["QuestionBank"] = None,
+) -> List[Dict]:
+    """Generate questions concurrently on one event loop, in job order.
+
+    At most MAX_CONCURRENT questions are in flight, and at most RATE_LIMIT_PER_MINUTE
+    are generated per minute so bursts stay under the provider's rate limit. Both are
+    created per call because asyncio primitives bind to the event loop that first
+    waits on them.
+
+    Newly generated questions and cache hit counts are written to the cache once, after
+    every question is done.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    rate_limiter = _TokenBucket(RATE_LIMIT_PER_MINUTE, 60.0)
+    pending_writes: Optional[List[Tuple[str, Optional[str], str]]] = (
+        [] if cache is not None else None
+    )
+
+    async def generate(
+        requirements: QuestionRequirements, question_number: int, cache_key: str
+    ) -> Dict:
+        async with semaphore:
+            return await _generate_single_question(
+                requirements,
+                question_number,
+                cache,
+                cache_key,
+                blueprint_hash,
+                rate_limiter,
+                bank,
+                pending_writes,
+            )
+
+    questions = await asyncio.gather(*(generate(*job) for job in jobs))
+    if cache is not None:
+        cache.set_many(pending_writes)
+        cache.flush()
+    return questions
+
+
+def _cycle_to(values: Sequence[str], count: int, default: str) -> List[str]:
+    """Repeat values cyclically to count items, or default when values is empty."""
+    if not values:
+        return [default] * count
+    return list(islice(cycle(values), max(count, 0)))
+
+
+# Parsed blueprints by resolved path: ((mtime_ns, size), loaded blueprint). Regenerating
+# from the same blueprint skips the read and parse until the file changes on disk.
+_BLUEPRINT_CACHE: Dict[str, Tuple[Tuple[int, int], _LoadedBlueprint]] = {}
+
+
+# Shared across tool calls so its in-memory layer serves repeat papers without SQLite
+_QUESTION_CACHE: Optional[QuestionCache] = None
+
+
+def _get_question_cache() -> QuestionCache:
+    """Return the process-wide question cache, opening it on first use."""
+    global _QUESTION_CACHE
+    if _QUESTION_CACHE is None:
+        cache_settings = settings.question_cache
+        _QUESTION_CACHE = QuestionCache(
+            db_path=cache_settings.db_path,
+            ttl=timedelta(days=cache_settings.ttl_days) if cache_settings.ttl_days > 0 else None,
+        )
+    return _QUESTION_CACHE
+
+
+def _load_blueprint(blueprint_path: str) -> _LoadedBlueprint:
+    """Load a blueprint, its typed sections and topic -> chapter index, reusing unchanged files.
+
+    Args:
+        blueprint_path: Path to exam blueprint JSON file
+
+    Returns:
+        The loaded blueprint, shared between calls for the same file version
+    """
+    path = Path(blueprint_path)
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    cache_path = str(path.resolve())
+
+    cached = _BLUEPRINT_CACHE.get(cache_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    # Raw bytes are kept to fingerprint cached questions
+    blueprint_bytes = path.read_bytes()
+    blueprint = _json_loads(blueprint_bytes)
+
+    # Get syllabus scope
+    syllabus_scope = blueprint.get("syllabus_scope", {})
+    chapters_data = syllabus_scope.get("chapters", [])
+
+    # Build chapters/topics mapping
+    chapters_topics = {}
+    for chapter_data in chapters_data:
+        chapter_name = chapter_data.get("chapter_name", "")
+        topics = chapter_data.get("topics", [])
+        chapters_topics[chapter_name] = topics
+
+    # Topic -> chapter index, so each question resolves its chapter in O(1). The first
+    # chapter listing the topic wins, unless an ALL_TOPICS chapter comes before it;
+    # chapters after the first ALL_TOPICS chapter can never be chosen.
+    topic_to_chapter: Dict[str, str] = {}
+    all_topics_chapter = "General"
+    for ch_name, topics in chapters_topics.items():
+        if topics == ["ALL_TOPICS"]:
+            all_topics_chapter = ch_name
+            break
+        for chapter_topic in topics:
+            topic_to_chapter.setdefault(chapter_topic, ch_name)
+
+    loaded = _LoadedBlueprint(
+        blueprint=blueprint,
+        blueprint_hash=hash_blueprint(blueprint_bytes),
+        sections=tuple(
+            _BlueprintSection.from_dict(section) for section in blueprint.get("sections", [])
+        ),
+        topic_to_chapter=topic_to_chapter,
+        all_topics_chapter=all_topics_chapter,
+    )
+    _BLUEPRINT_CACHE[cache_path] = (version, loaded)
+    return loaded
+
+
 @tool
 def generate_question_paper_tool(
     blueprint_path: str,
     output_path: Optional[str] = None,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Generates complete CBSE question paper from blueprint.
@@ -225,6 +527,8 @@ def generate_question_paper_tool(
     Args:
         blueprint_path: Path to exam blueprint JSON file
         output_path: Where to save generated paper (auto-generated if None)
+        use_cache: False generates every question afresh, without reading or writing the
+            question cache (which is only used when QUESTION_CACHE__ENABLED is set)
 
     Returns:
         {
@@ -238,9 +542,11 @@ def generate_question_paper_tool(
         }
     """
     try:
-        # Load blueprint
-        with open(blueprint_path, "r", encoding="utf-8") as f:
-            blueprint = json.load(f)
+        # Load blueprint (parsed once per file version; treated as read-only below)
+        loaded = _load_blueprint(blueprint_path)
+        blueprint = loaded.blueprint
+        topic_to_chapter = loaded.topic_to_chapter
+        all_topics_chapter = loaded.all_topics_chapter
 
         # Extract metadata
         metadata = blueprint.get("metadata", {})
@@ -248,65 +554,40 @@ def generate_question_paper_tool(
         subject = metadata.get("subject", "Mathematics")
         total_marks = metadata.get("total_marks", 0)
 
-        # Get syllabus scope
-        syllabus_scope = blueprint.get("syllabus_scope", {})
-        chapters_data = syllabus_scope.get("chapters", [])
-
-        # Build chapters/topics mapping
-        chapters_topics = {}
-        for chapter_data in chapters_data:
-            chapter_name = chapter_data.get("chapter_name", "")
-            topics = chapter_data.get("topics", [])
-            chapters_topics[chapter_name] = topics
-
         # Process sections
         sections = []
-        all_questions = []
         question_counter = 1
         difficulty_distribution = {"easy": 0, "medium": 0, "hard": 0}
 
-        for section in blueprint.get("sections", []):
-            section_id = section.get("section_id", "")
-            questions_provided = section.get("questions_provided", 0)
-            marks_per_question = section.get("marks_per_question", 0)
-            question_format = section.get("question_format", "MCQ")
-            topic_focus = section.get("topic_focus", [])
-            allowed_natures = section.get("allowed_question_natures", ["NUMERICAL"])
-            cognitive_hints = section.get("cognitive_level_hint", [])
+        # (requirements, question number, cache key) per question, and the section list
+        # it belongs to
+        jobs: List[Tuple[QuestionRequirements, int, str]] = []
+        job_sections: List[List[Dict]] = []
+        # Questions so far with the same requirements, so repeats get distinct cache keys
+        requirement_counts: Dict[QuestionRequirements, int] = {}
 
-            # Calculate difficulty distribution (40/40/20)
-            easy_count = int(questions_provided * 0.4)
-            medium_count = int(questions_provided * 0.4)
-            hard_count = questions_provided - easy_count - medium_count
+        for section in loaded.sections:
+            questions_provided = section.questions_provided
+            marks_per_question = section.marks_per_question
+            question_format = section.question_format
 
-            section_questions = []
+            # Calculate difficulty distribution (40/40/20)
+            easy_count, medium_count, hard_count = _difficulty_counts(questions_provided)
 
-            for i in range(questions_provided):
-                # Determine difficulty
-                if i < easy_count:
-                    difficulty = "easy"
-                elif i < easy_count + medium_count:
-                    difficulty = "medium"
-                else:
-                    difficulty = "hard"
+            # Per-question difficulty, topic, nature and cognitive level for the whole
+            # section: difficulties run easy -> medium -> hard, the rest cycle their lists
+            difficulties = ["easy"] * easy_count + ["medium"] * medium_count + ["hard"] * hard_count
+            topics = _cycle_to(section.topic_focus, questions_provided, "General")
+            natures = _cycle_to(section.allowed_question_natures, questions_provided, "NUMERICAL")
+            cognitives = _cycle_to(section.cognitive_level_hint, questions_provided, "REMEMBER")
 
-                # Select topic
-                topic = topic_focus[i % len(topic_focus)] if topic_focus else "General"
+            section_questions = []
 
+            for difficulty, topic, nature, cognitive in zip(
+                difficulties, topics, natures, cognitives
+            ):
                 # Find chapter for topic
-                chapter = "General"
-                for ch_name, topics in chapters_topics.items():
-                    if topic in topics or topics == ["ALL_TOPICS"]:
-                        chapter = ch_name
-                        break
-
-                # Select nature and cognitive level
-                nature = (
-                    allowed_natures[i % len(allowed_natures)] if allowed_natures else "NUMERICAL"
-                )
-                cognitive = (
-                    cognitive_hints[i % len(cognitive_hints)] if cognitive_hints else "REMEMBER"
-                )
+                chapter = topic_to_chapter.get(topic, all_topics_chapter)
 
                 # Create requirements
                 requirements = QuestionRequirements(
@@ -321,23 +602,37 @@ def generate_question_paper_tool(
                     cognitive_level=cognitive,
                 )
 
-                # Generate question
-                question = asyncio.run(_generate_single_question(requirements, question_counter))
-
-                section_questions.append(question)
-                all_questions.append(question)
+                # Queue question; all questions are generated together below
+                occurrence = requirement_counts.get(requirements, 0)
+                requirement_counts[requirements] = occurrence + 1
+                jobs.append(
+                    (requirements, question_counter, make_cache_key(requirements, occurrence))
+                )
+                job_sections.append(section_questions)
                 difficulty_distribution[difficulty] += 1
                 question_counter += 1
 
             sections.append(
                 {
-                    "section_id": section_id,
-                    "title": section.get("section_title", ""),
+                    "section_id": section.section_id,
+                    "title": section.section_title,
                     "questions": section_questions,
                     "section_total": questions_provided * marks_per_question,
                 }
             )
 
+        # Generate every question in one event loop, overlapping their I/O
+        cache = _get_question_cache() if use_cache and settings.question_cache.enabled else None
+        bank = None
+        if settings.question_bank.enabled:
+            from .question_bank import QuestionBank
+
+            bank = QuestionBank()
+        with asyncio.Runner(loop_factory=_EVENT_LOOP_FACTORY) as runner:
+            questions = runner.run(_generate_questions(jobs, cache, loaded.blueprint_hash, bank))
+        for question, section_questions in zip(questions, job_sections):
+            section_questions.append(question)
+
         # Create paper structure
         paper = {
             "paper_id": f"{subject.upper()}-{class_level}-{datetime.now().strftime('%Y%m%d')}",
@@ -349,7 +644,7 @@ def generate_question_paper_tool(
                 "duration_minutes": blueprint.get("duration_minutes", 120),
             },
             "sections": sections,
-            "total_marks": sum(q["marks"] for q in all_questions),
+            "total_marks": sum(q["marks"] for q in questions),
             "generated_at": datetime.now().isoformat(),
         }
 
@@ -358,13 +653,17 @@ def generate_question_paper_tool(
             output_path = f"output/{subject.lower()}_class{class_level}_paper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(paper, f, indent=2)
+        with open(output_path, "wb") as f:
+            _write_json_streamed(f, paper, _PAPER_STREAM_DEPTH)
+
+        # Bank the paper's questions for semantic reuse by later papers
+        if bank is not None:
+            bank.add(questions)
 
         return {
             "success": True,
             "paper_path": output_path,
-            "total_questions": len(all_questions),
+            "total_questions": len(questions),
             "total_marks": paper["total_marks"],
             "sections_generated": [s["section_id"] for s in sections],
             "difficulty_distribution": difficulty_distribution,
@@ -389,15 +688,21 @@ def _distribute_difficulties(total_questions: int) -> Dict[str, int]:
     Returns:
         Dict with counts for easy, medium, hard
     """
-    if total_questions == 0:
-        return {"easy": 0, "medium": 0, "hard": 0}
-
-    easy_count = int(total_questions * 0.4)
-    medium_count = int(total_questions * 0.4)
-    hard_count = total_questions - easy_count - medium_count
+    easy_count, medium_count, hard_count = _difficulty_counts(total_questions)
 
     return {
         "easy": easy_count,
         "medium": medium_count,
         "hard": hard_count,
     }
+
+
+@lru_cache(maxsize=128)
+def _difficulty_counts(total_questions: int) -> Tuple[int, int, int]:
+    """(easy, medium, hard) counts under the 40/40/20 rule; hard takes the remainder.
+
+    Cached as an immutable tuple, since section sizes repeat across sections and papers.
+    """
+    easy_count = int(total_questions * 0.4)
+    medium_count = int(total_questions * 0.4)
+    return easy_count, medium_count, total_questions - easy_count - medium_count
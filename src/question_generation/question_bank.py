@@ -0,0 +1,156 @@
+"""Semantic bank of generated questions stored in Qdrant.
+
+QuestionCache only reuses a question when its requirements match exactly. The bank
+stores every generated question with an embedding of its chapter, topic, difficulty and
+text, so later papers can reuse a question for a semantically similar topic (e.g. a
+renamed or reworded topic_focus entry) as long as its format, marks, difficulty and
+cognitive level match.
+"""
+
+import logging
+import threading
+import uuid
+from typing import Any, Dict, List, Optional
+
+from qdrant_client.http.models import FieldCondition, Filter, MatchValue, PointStruct
+
+from cbse_question_retriever.embedder import embedding_generator
+from cbse_question_retriever.qdrant_client import qdrant_manager
+
+logger = logging.getLogger(__name__)
+
+QUESTION_BANK_COLLECTION = "cbse_question_bank"
+
+# Minimum cosine similarity for a banked question to stand in for a new one
+QUESTION_BANK_SCORE_THRESHOLD = 0.92
+
+# Candidates fetched per lookup, so questions already used in the paper can be skipped
+QUESTION_BANK_CANDIDATES = 3
+
+# Points embedded and upserted per request
+UPSERT_BATCH_SIZE = 100
+
+
+def _bank_text(chapter: str, topic: str, difficulty: str, question_text: str = "") -> str:
+    """Text embedded for a question (indexing) or for requirements (lookup)."""
+    return f"{chapter} {topic} {difficulty} {question_text}".strip()
+
+
+def _point_id(question: Dict[str, Any]) -> str:
+    """Stable point ID, so re-adding the same question overwrites rather than duplicates."""
+    identity = "|".join(
+        str(question.get(field))
+        for field in ("chapter", "topic", "question_format", "marks", "question_text")
+    )
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, identity))
+
+
+class QuestionBank:
+    """Qdrant-backed store of generated questions, searched by semantic similarity.
+
+    Create one instance per paper: it remembers which banked questions it has handed
+    out so the same question is not used twice in one paper.
+    """
+
+    def __init__(
+        self,
+        collection_name: str = QUESTION_BANK_COLLECTION,
+        score_threshold: float = QUESTION_BANK_SCORE_THRESHOLD,
+    ):
+        """Set up the bank; the collection is created on first use.
+
+        Args:
+            collection_name: Qdrant collection holding banked questions
+            score_threshold: Minimum similarity for a banked question to be reused
+        """
+        self.collection_name = collection_name
+        self.score_threshold = score_threshold
+        self._collection_ready = False
+        self._taken: set = set()
+        self._lock = threading.Lock()
+
+    def _ensure_collection(self) -> None:
+        """Create the bank collection if it does not exist yet."""
+        if not self._collection_ready:
+            if not qdrant_manager.check_collection_exists(self.collection_name):
+                qdrant_manager.create_collection(self.collection_name)
+            self._collection_ready = True
+
+    def take(self, requirements: Any) -> Optional[Dict[str, Any]]:
+        """Find a banked question matching requirements that this paper has not used.
+
+        Args:
+            requirements: QuestionRequirements dataclass instance
+
+        Returns:
+            Copy of the banked question, or None when nothing is similar enough (or the
+            bank is unavailable)
+        """
+        try:
+            self._ensure_collection()
+            query_vector = embedding_generator.generate_embedding(
+                _bank_text(requirements.chapter, requirements.topic, requirements.difficulty)
+            )
+            points = qdrant_manager.client.query_points(
+                collection_name=self.collection_name,
+                query=query_vector,
+                query_filter=Filter(
+                    must=[
+                        FieldCondition(key=key, match=MatchValue(value=value))
+                        for key, value in (
+                            ("question_format", requirements.question_format),
+                            ("marks", requirements.marks),
+                            ("difficulty", requirements.difficulty),
+                            ("bloom_level", requirements.cognitive_level.lower()),
+                        )
+                    ]
+                ),
+                limit=QUESTION_BANK_CANDIDATES,
+                score_threshold=self.score_threshold,
+                with_payload=True,
+            ).points
+        except Exception as e:
+            logger.warning(f"Question bank lookup failed: {e}")
+            return None
+
+        with self._lock:
+            for point in points:
+                point_id = str(point.id)
+                if point_id not in self._taken:
+                    self._taken.add(point_id)
+                    return dict(point.payload)
+        return None
+
+    def add(self, questions: List[Dict[str, Any]]) -> int:
+        """Embed and store questions in the bank.
+
+        Args:
+            questions: Generated question dictionaries
+
+        Returns:
+            Number of distinct questions stored (0 if the bank is unavailable)
+        """
+        unique = {_point_id(question): question for question in questions}
+        point_ids = list(unique)
+        try:
+            self._ensure_collection()
+            for start in range(0, len(point_ids), UPSERT_BATCH_SIZE):
+                batch_ids = point_ids[start : start + UPSERT_BATCH_SIZE]
+                batch = [unique[point_id] for point_id in batch_ids]
+                vectors = embedding_generator.generate_embeddings_batch(
+                    [
+                        _bank_text(q["chapter"], q["topic"], q["difficulty"], q["question_text"])
+                        for q in batch
+                    ]
+                )
+                qdrant_manager.client.upsert(
+                    collection_name=self.collection_name,
+                    points=[
+                        PointStruct(id=point_id, vector=vector, payload=question)
+                        for point_id, vector, question in zip(batch_ids, vectors, batch)
+                    ],
+                )
+        except Exception as e:
+            logger.warning(f"Question bank update failed: {e}")
+            return 0
+        return len(point_ids)
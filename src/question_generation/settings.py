@@ -0,0 +1,44 @@
+"""Configuration settings for question paper generation."""
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from .cache import CACHE_DB_PATH
+
+
+class QuestionCacheSettings(BaseModel):
+    """Exact-match question cache settings."""
+
+    enabled: bool = Field(
+        default=False, description="Reuse questions generated earlier for identical requirements"
+    )
+    ttl_days: float = Field(
+        default=30, description="Days a cached question stays reusable (0 = never expires)"
+    )
+    db_path: Path = Field(default=CACHE_DB_PATH, description="SQLite database file for the cache")
+
+
+class QuestionBankSettings(BaseModel):
+    """Semantic question bank settings."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Reuse similar questions from earlier papers (needs Qdrant and OpenAI)",
+    )
+
+
+class QuestionGenerationSettings(BaseSettings):
+    """Main settings class for question paper generation."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", env_nested_delimiter="__", extra="ignore"
+    )
+
+    question_cache: QuestionCacheSettings = Field(default_factory=QuestionCacheSettings)
+    question_bank: QuestionBankSettings = Field(default_factory=QuestionBankSettings)
+
+
+# Global settings instance
+settings = QuestionGenerationSettings()
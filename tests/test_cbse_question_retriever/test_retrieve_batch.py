@@ -0,0 +1,168 @@
+"""Tests for grouped retrieval of several questions in one section."""
+
+import json
+
+import pytest
+
+from cbse_question_retriever import retriever as retriever_module
+from cbse_question_retriever import tool as tool_module
+from cbse_question_retriever.data_types import Chunk, ChunkType
+from cbse_question_retriever.retriever import BlueprintRetriever
+from cbse_question_retriever.tool import generate_question_tool, generate_section_questions_tool
+
+BLUEPRINT = {
+    "metadata": {"class": 10, "subject": "Mathematics"},
+    "syllabus_scope": {
+        "chapters": [
+            {"chapter_name": "Polynomials", "topics": ["Zeros of a Polynomial"]},
+            {"chapter_name": "Triangles", "topics": ["Similarity"]},
+        ]
+    },
+    "sections": [
+        {
+            "section_id": "A",
+            "title": "Section A",
+            "question_format": "MCQ",
+            "marks_per_question": 1,
+            "questions_provided": 5,
+            "topic_focus": ["Zeros of a Polynomial", "Similarity"],
+            "cognitive_level_hint": ["REMEMBER"],
+            "allowed_question_natures": ["NUMERICAL"],
+        }
+    ],
+}
+
+
+class FakeQdrant:
+    """Records searches and returns one chunk per search."""
+
+    def __init__(self):
+        self.batches = []
+
+    def check_collection_exists(self, collection_name):
+        return True
+
+    def get_distinct_topics(self, collection_name, chapter=None):
+        return ["Zeros of a Polynomial", "Similarity"]
+
+    def search_by_vectors_batch(self, collection_name, searches, limit=10):
+        self.batches.append(searches)
+        return [
+            [
+                Chunk(
+                    id=f"{filters['chapter']}-1",
+                    text="content",
+                    chapter=filters["chapter"],
+                    section="1.1",
+                    topic="",
+                    chunk_type=ChunkType.THEORY,
+                    page_start=1,
+                    page_end=1,
+                    score=0.9,
+                )
+            ]
+            for _, filters in searches
+        ]
+
+
+class FakeEmbedder:
+    """Records embedded texts."""
+
+    def __init__(self):
+        self.texts = []
+
+    def generate_embeddings_batch(self, texts):
+        self.texts.extend(texts)
+        return [[float(i)] for i in range(len(texts))]
+
+
+@pytest.fixture
+def blueprint_path(tmp_path):
+    path = tmp_path / "blueprint.json"
+    path.write_text(json.dumps(BLUEPRINT))
+    return str(path)
+
+
+@pytest.fixture
+def fakes(monkeypatch):
+    qdrant, embedder = FakeQdrant(), FakeEmbedder()
+    monkeypatch.setattr(retriever_module, "qdrant_manager", qdrant)
+    monkeypatch.setattr(retriever_module, "embedding_generator", embedder)
+    return qdrant, embedder
+
+
+class TestRetrieveBatch:
+    """Questions sharing a query are searched once, in a single batch."""
+
+    def test_groups_questions_by_topic(self, blueprint_path, fakes):
+        qdrant, embedder = fakes
+
+        results = BlueprintRetriever().retrieve_batch(blueprint_path, "A", [1, 2, 3, 4, 5])
+
+        assert len(qdrant.batches) == 1
+        assert len(qdrant.batches[0]) == 2
+        assert len(embedder.texts) == 2
+        assert [r.chapter for r in results] == [
+            "Polynomials",
+            "Triangles",
+            "Polynomials",
+            "Triangles",
+            "Polynomials",
+        ]
+        assert all(r.error is None for r in results)
+        assert len({r.question_id for r in results}) == 5
+
+    def test_matches_single_retrieve(self, blueprint_path, fakes):
+        batch = BlueprintRetriever().retrieve_batch(blueprint_path, "A", [3, 1])
+        single = [BlueprintRetriever().retrieve(blueprint_path, "A", n) for n in (3, 1)]
+
+        assert batch == single
+
+    def test_missing_blueprint_errors_every_question(self, tmp_path, fakes):
+        results = BlueprintRetriever().retrieve_batch(str(tmp_path / "missing.json"), "A", [1, 2])
+
+        assert len(results) == 2
+        assert all(r.error.startswith("Blueprint file not found") for r in results)
+
+    def test_errors_are_separate_per_question(self, tmp_path, fakes):
+        results = BlueprintRetriever().retrieve_batch(str(tmp_path / "missing.json"), "A", [1, 2])
+
+        assert results[0] is not results[1]
+        results[0].blueprint_reference["note"] = "changed"
+        assert results[1].blueprint_reference == {}
+
+    def test_unknown_topic_errors_are_separate(self, tmp_path, fakes):
+        blueprint = json.loads(json.dumps(BLUEPRINT))
+        blueprint["sections"][0]["topic_focus"] = ["Unknown Topic"]
+        path = tmp_path / "blueprint.json"
+        path.write_text(json.dumps(blueprint))
+
+        results = BlueprintRetriever().retrieve_batch(str(path), "A", [1, 2])
+
+        assert all(r.error.startswith("Topic 'Unknown Topic' not found") for r in results)
+        assert results[0] is not results[1]
+
+
+class TestSectionQuestionsTool:
+    """The section tool returns one retrieval result per question in one call."""
+
+    def test_matches_single_question_tool(self, blueprint_path, fakes):
+        qdrant, _ = fakes
+
+        section = generate_section_questions_tool.func(blueprint_path, "A", [1, 2, 3])
+
+        assert len(qdrant.batches) == 1
+        single = [generate_question_tool.func(blueprint_path, "A", n) for n in (1, 2, 3)]
+        assert section == single
+
+    def test_unexpected_error_gives_separate_responses(self, blueprint_path, monkeypatch):
+        def fail(**kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(tool_module.retriever, "retrieve_batch", fail)
+
+        results = generate_section_questions_tool.func(blueprint_path, "A", [1, 2])
+
+        assert [r["error"] for r in results] == ["Tool execution error: boom"] * 2
+        assert results[0] is not results[1]
+        assert results[0]["chunks"] is not results[1]["chunks"]
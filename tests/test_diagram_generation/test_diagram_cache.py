@@ -0,0 +1,51 @@
+"""Unit tests for reuse of generated diagrams."""
+
+import base64
+
+import pytest
+
+from diagram_generation import tool as diagram_tool
+from diagram_generation.tool import generate_diagram_tool
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    """Replace the geometric renderer with a counting stub and clear the cache."""
+    calls = []
+
+    def fake_render(description, elements=None):
+        calls.append(description)
+        return f"<svg>{description} {elements}</svg>"
+
+    monkeypatch.setattr(diagram_tool, "_generate_geometric_diagram", fake_render)
+    monkeypatch.setattr(diagram_tool, "_DIAGRAM_CACHE", {})
+    return calls
+
+
+class TestDiagramCache:
+    """Tests for the encoded-SVG cache in generate_diagram_tool."""
+
+    def test_repeated_request_renders_once(self, render_calls):
+        """Verify an identical request reuses the encoded SVG."""
+        elements = {"shape": "triangle", "coordinates": {"A": (0, 0)}}
+        first = generate_diagram_tool.func("Triangle ABC", "geometric", elements)
+        second = generate_diagram_tool.func("Triangle ABC", "geometric", dict(elements))
+
+        assert render_calls == ["Triangle ABC"]
+        assert first == second
+        assert base64.b64decode(first["diagram_svg_base64"]).startswith(b"<svg>")
+
+    def test_different_elements_render_separately(self, render_calls):
+        """Verify requests differing only in elements are not conflated."""
+        generate_diagram_tool.func("Triangle", "geometric", {"coordinates": {"A": (0, 0)}})
+        generate_diagram_tool.func("Triangle", "geometric", {"coordinates": {"A": [0, 0]}})
+
+        assert len(render_calls) == 2
+
+    def test_failures_are_not_cached(self, monkeypatch):
+        """Verify a failed render is retried on the next request."""
+        monkeypatch.setattr(diagram_tool, "_DIAGRAM_CACHE", {})
+        monkeypatch.setattr(diagram_tool, "_generate_geometric_diagram", lambda d, e=None: None)
+
+        assert not generate_diagram_tool.func("Circle", "geometric")["success"]
+        assert diagram_tool._DIAGRAM_CACHE == {}
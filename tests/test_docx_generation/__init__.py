@@ -0,0 +1 @@
+"""Tests for DOCX generation domain."""
@@ -0,0 +1,157 @@
+"""Unit tests for choosing where diagram PNGs are rendered."""
+
+import base64
+import struct
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("docx")
+
+from docx import Document
+
+from docx_generation import tool as docx_tool
+
+
+def _svg(n: int) -> str:
+    svg = f'<svg xmlns="http://www.w3.org/2000/svg" width="{n + 1}" height="1"/>'
+    return base64.b64encode(svg.encode()).decode()
+
+
+def _sections(count: int) -> list:
+    questions = [{"has_diagram": True, "diagram_svg_base64": _svg(n)} for n in range(count)]
+    return [{"section_id": "A", "questions": questions}]
+
+
+def _png() -> bytes:
+    """A valid 1x1 white PNG, standing in for a cairosvg render."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(b"\x00\xff"))
+        + chunk(b"IEND", b"")
+    )
+
+
+class RecordingPool:
+    """Stands in for the process pool, rendering submissions inline."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class BrokenPool:
+    """A process pool that cannot accept work."""
+
+    def __init__(self, error):
+        self.error = error
+
+    def submit(self, fn, *args):
+        raise self.error
+
+    def shutdown(self, wait=True):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def empty_png_cache(monkeypatch):
+    """Start every test with no rendered PNGs cached."""
+    monkeypatch.setattr(docx_tool, "_png_cache", OrderedDict())
+
+
+class TestDiagramRenderPool:
+    """Tests for _start_diagram_renders executor selection."""
+
+    def test_few_diagrams_render_in_threads(self, monkeypatch):
+        """Verify papers below the threshold never start the process pool."""
+        monkeypatch.setattr(
+            docx_tool, "_get_process_pool", lambda: pytest.fail("process pool used")
+        )
+        count = docx_tool.PROCESS_POOL_MIN_DIAGRAMS - 1
+
+        futures = docx_tool._start_diagram_renders(_sections(count))
+
+        assert set(futures) == {(0, n) for n in range(count)}
+        for future in futures.values():
+            future.result(timeout=30)
+
+    def test_many_diagrams_use_shared_pool(self, monkeypatch):
+        """Verify diagram-heavy papers are rendered by the shared process pool."""
+        pool = RecordingPool()
+        monkeypatch.setattr(docx_tool, "_get_process_pool", lambda: pool)
+        count = docx_tool.PROCESS_POOL_MIN_DIAGRAMS
+
+        futures = docx_tool._start_diagram_renders(_sections(count))
+
+        assert pool.submitted == count
+        assert set(futures) == {(0, n) for n in range(count)}
+
+    @pytest.mark.parametrize(
+        "error",
+        [BrokenProcessPool("worker died"), RuntimeError("bootstrapping phase")],
+    )
+    def test_broken_pool_falls_back_to_threads(self, monkeypatch, error):
+        """Verify a pool that cannot run workers is discarded and the paper still renders."""
+        pool = BrokenPool(error)
+        monkeypatch.setattr(docx_tool, "_process_pool", pool)
+
+        futures = docx_tool._start_diagram_renders(_sections(4))
+
+        assert docx_tool._process_pool is None
+        for future in futures.values():
+            future.result(timeout=30)
+
+    def test_process_pool_is_spawned_and_shared(self, monkeypatch):
+        """Verify the pool uses spawn, is reused across papers and renders in a worker."""
+        monkeypatch.setattr(docx_tool, "_process_pool", None)
+        pool = docx_tool._get_process_pool()
+        try:
+            assert docx_tool._get_process_pool() is pool
+            assert pool._mp_context.get_start_method() == "spawn"
+
+            png = pool.submit(docx_tool._svg_base64_to_png, _svg(9), 10).result(timeout=120)
+            assert (png is not None) == docx_tool.HAVE_CAIROSVG
+        finally:
+            pool.shutdown()
+
+
+class TestEmbedDiagram:
+    """Tests for _embed_diagram when a render future fails."""
+
+    @pytest.mark.parametrize(
+        "error, discarded",
+        [(BrokenProcessPool("worker died"), True), (ValueError("bad pickle"), False)],
+    )
+    def test_failed_render_is_redone_inline(self, monkeypatch, error, discarded):
+        """Verify a failed render is redone inline and a broken pool is discarded."""
+        pool = BrokenPool(error)
+        monkeypatch.setattr(docx_tool, "_process_pool", pool)
+        rendered = []
+        monkeypatch.setattr(
+            docx_tool, "_svg_base64_to_png", lambda svg: rendered.append(svg) or _png()
+        )
+        question = {"has_diagram": True, "diagram_svg_base64": _svg(1)}
+        future = Future()
+        future.set_exception(error)
+        doc = Document()
+
+        assert docx_tool._embed_diagram(doc, question, future) is True
+
+        assert rendered == [question["diagram_svg_base64"]]
+        assert len(doc.inline_shapes) == 1
+        assert (docx_tool._process_pool is None) == discarded
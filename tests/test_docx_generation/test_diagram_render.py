@@ -0,0 +1,32 @@
+"""Unit tests for rendering diagram SVGs to PNG for the DOCX."""
+
+import base64
+import struct
+from io import BytesIO
+
+import pytest
+
+pytest.importorskip("docx")
+
+from docx_generation import tool as docx_tool
+
+_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="50">'
+    '<rect width="100" height="50" fill="#ff0000"/></svg>'
+)
+
+
+@pytest.mark.skipif(not docx_tool.HAVE_CAIROSVG, reason="cairosvg or the cairo library missing")
+class TestSvgToPng:
+    """Tests for _svg_base64_to_png."""
+
+    def test_round_trip(self):
+        """Verify the PNG has the requested width, the SVG's aspect ratio and its colours."""
+        png = docx_tool._svg_base64_to_png(base64.b64encode(_SVG.encode()).decode(), width=200)
+
+        assert png.startswith(b"\x89PNG\r\n\x1a\n")
+        assert struct.unpack(">II", png[16:24]) == (200, 100)
+
+        image = pytest.importorskip("PIL.Image")
+        with image.open(BytesIO(png)) as decoded:
+            assert decoded.convert("RGBA").getpixel((0, 0)) == (255, 0, 0, 255)
@@ -0,0 +1,92 @@
+"""Unit tests for validating question paper JSON before DOCX rendering."""
+
+import json
+
+import pytest
+
+pytest.importorskip("docx")
+pytest.importorskip("fastjsonschema")
+
+import fastjsonschema
+
+from docx_generation.tool import PAPER_SCHEMA, generate_docx_tool
+
+
+def _valid_paper() -> dict:
+    """A paper the renderer accepts, including the loosely typed fields it tolerates."""
+    return {
+        "exam_metadata": {
+            "subject": "Mathematics",
+            "class": 10,
+            "exam_type": "Unit Test",
+            "duration_minutes": 90,
+            "total_marks": 6,
+        },
+        "sections": [
+            {
+                "section_id": "A",
+                "title": None,
+                "marks_per_question": None,
+                "questions": [
+                    {
+                        "question_number": 1,
+                        "question_text": None,
+                        "question_format": "MCQ",
+                        "marks": 1,
+                        "options": {"A": "1", "B": "2", "C": "3", "D": "4"},
+                        "diagram_svg_base64": None,
+                    },
+                    {
+                        "question_number": 2,
+                        "question_text": "Solve the case study.",
+                        "marks": 5,
+                        "has_sub_questions": True,
+                        "sub_questions": [
+                            {"part": None, "text": "Find x.", "marks": 2},
+                            {"part": "ii", "text": None, "marks": 3},
+                        ],
+                    },
+                ],
+            }
+        ],
+    }
+
+
+def _write(tmp_path, paper: dict) -> str:
+    path = tmp_path / "paper.json"
+    path.write_text(json.dumps(paper))
+    return str(path)
+
+
+class TestPaperSchema:
+    """The schema rejects only what the renderer cannot handle."""
+
+    def test_accepts_paper_the_renderer_accepts(self, tmp_path):
+        paper = _valid_paper()
+        fastjsonschema.validate(PAPER_SCHEMA, paper)
+
+        result = generate_docx_tool.func(_write(tmp_path, paper), str(tmp_path / "paper.docx"))
+
+        assert result["success"] is True
+
+    @pytest.mark.parametrize(
+        "path, value",
+        [
+            (("sections",), None),
+            (("sections", 0, "questions", 0, "marks"), None),
+            (("sections", 0, "questions", 1, "sub_questions", 0, "marks"), None),
+            (("exam_metadata", "subject"), 10),
+        ],
+    )
+    def test_rejects_paper_the_renderer_cannot_handle(self, tmp_path, path, value):
+        paper = _valid_paper()
+        target = paper
+        for key in path[:-1]:
+            target = target[key]
+        target[path[-1]] = value
+
+        result = generate_docx_tool.func(_write(tmp_path, paper), str(tmp_path / "paper.docx"))
+
+        assert result["success"] is False
+        assert result["error"].startswith("Invalid question paper JSON")
+        assert not (tmp_path / "paper.docx").exists()
@@ -0,0 +1,74 @@
+"""Unit tests for how question paragraphs are written into the DOCX body."""
+
+import json
+
+import pytest
+
+pytest.importorskip("docx")
+
+from docx import Document
+from docx.oxml.ns import qn
+
+from docx_generation.tool import generate_docx_tool
+
+
+@pytest.fixture
+def rendered(tmp_path):
+    """Render a small two-section paper and reopen the saved document."""
+    paper = {
+        "exam_metadata": {
+            "subject": "Science",
+            "class": 10,
+            "exam_type": "Unit Test",
+            "duration_minutes": 60,
+            "total_marks": 7,
+        },
+        "sections": [
+            {
+                "section_id": "A",
+                "questions": [
+                    {"question_text": "Define force.", "marks": 1},
+                    # Tabs take the add_run path instead of the cloned prototype
+                    {"question_text": "State\tNewton's law.", "marks": 1},
+                ],
+            },
+            {
+                "section_id": "B",
+                "questions": [{"question_text": "Explain inertia.", "marks": 5}],
+            },
+        ],
+    }
+    json_path = tmp_path / "paper.json"
+    json_path.write_text(json.dumps(paper))
+    docx_path = tmp_path / "paper.docx"
+
+    result = generate_docx_tool.func(str(json_path), str(docx_path))
+
+    assert result["success"] is True
+    return Document(str(docx_path))
+
+
+class TestQuestionParagraphs:
+    """Question paragraphs keep their text and document order."""
+
+    def test_paragraph_text_and_order(self, rendered):
+        texts = [p.text for p in rendered.paragraphs if p.text]
+        expected = [
+            "SECTION A",
+            "1. Define force. (1 mark)",
+            "2. State\tNewton's law. (1 mark)",
+            "SECTION B",
+            "3. Explain inertia. (5 marks)",
+        ]
+
+        assert [t for t in texts if t in expected] == expected
+
+    def test_question_number_is_bold(self, rendered):
+        para = next(p for p in rendered.paragraphs if p.text == "1. Define force. (1 mark)")
+
+        assert para.runs[0].text == "1."
+        assert para.runs[0].bold is True
+        assert para.runs[1].text == " Define force. (1 mark)"
+
+    def test_section_properties_stay_last(self, rendered):
+        assert rendered.element.body[-1].tag == qn("w:sectPr")
@@ -0,0 +1 @@
+"""Tests for question assembler domain."""
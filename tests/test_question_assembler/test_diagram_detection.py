@@ -0,0 +1,124 @@
+"""Unit tests for keyword-based diagram detection."""
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from question_assembler.tool import (
+    assemble_question_tool,
+    detect_diagram_need,
+)
+
+
+def _detect(text: str) -> dict:
+    return detect_diagram_need(text, topic="", chapter="", question_format="SHORT")
+
+
+class TestDiagramDetection:
+    """Tests for detect_diagram_need keyword matching."""
+
+    def test_geometric_keyword(self):
+        """Verify a triangle question needs a geometric diagram."""
+        result = _detect("Find the area of the triangle ABC")
+        assert result["diagram_needed"] is True
+        assert result["diagram_type"] == "geometric"
+        assert result["reason"] == "Detected keyword: triangle"
+
+    def test_plural_keyword(self):
+        """Verify plural forms of keywords are detected."""
+        assert _detect("Two circles touch externally")["diagram_type"] == "geometric"
+
+    def test_symbol_keyword(self):
+        """Verify the angle symbol is detected without word boundaries."""
+        assert _detect("If ∠ABC = 90, find AC")["diagram_type"] == "geometric"
+
+    def test_category_precedence(self):
+        """Verify geometric keywords take precedence over coordinate and chart ones."""
+        result = _detect("Plot the graph and find the height of the pole")
+        assert result["diagram_type"] == "geometric"
+
+    def test_overlapping_keywords(self):
+        """Verify a keyword inside a longer keyword is still seen and can outrank it."""
+        assert _detect("Mark the x-coordinates")["reason"] == "Detected keyword: coordinate"
+
+    def test_chart_keyword(self):
+        """Verify chart keywords are detected."""
+        assert _detect("Draw a histogram for the data")["diagram_type"] == "chart"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Solve using the quadratic formula",
+            "since x is even",
+            "inside the set",
+            "Find the second term",
+            "The cost of 3 pens",
+        ],
+    )
+    def test_keywords_inside_other_words_ignored(self, text):
+        """Verify short keywords (sin, side, sec, cos) do not match inside longer words."""
+        assert _detect(text)["diagram_needed"] is False
+
+    @pytest.mark.parametrize(
+        "text, diagram_type, keyword",
+        [
+            ("Find the sine of 30 degrees", "geometric", "sine"),
+            ("State the cosine rule", "geometric", "cosine"),
+            ("Find the area of the rectangle", "geometric", "rectangle"),
+            ("ABCD is a parallelogram", "geometric", "parallelogram"),
+            ("Line PQ is a secant", "geometric", "secant"),
+            ("Solve the pair of linear equations", "coordinate", "linear"),
+            ("Solve by the graphical method", "coordinate", "graphical"),
+        ],
+    )
+    def test_longer_keyword_forms(self, text, diagram_type, keyword):
+        """Verify longer words that start with a short keyword are still detected."""
+        result = _detect(text)
+        assert result["diagram_type"] == diagram_type
+        assert result["reason"] == f"Detected keyword: {keyword}"
+
+    def test_topic_and_chapter_scanned(self):
+        """Verify keywords in the topic or chapter are detected without joining the texts."""
+        result = detect_diagram_need("Find x", topic="", chapter="Circles", question_format="MCQ")
+        assert result["reason"] == "Detected keyword: circle"
+
+
+class TestLlmDiagramType:
+    """Tests for honouring the LLM-provided diagram type during assembly."""
+
+    @staticmethod
+    def _detection(llm_result):
+        retrieval = {"chapter": "Triangles", "topic": "Similarity", "question_format": "SHORT"}
+        assembled = assemble_question_tool.func(retrieval, llm_result, 1)
+        return assembled["generation_metadata"]["diagram_detection"]
+
+    def test_supported_llm_type_skips_keyword_scan(self):
+        """Verify a supported LLM diagram type is used instead of keyword detection."""
+        detection = self._detection(
+            {"question_text": "Plot the points", "diagram_needed": True, "diagram_type": "chart"}
+        )
+        assert detection == {
+            "diagram_needed": True,
+            "diagram_type": "chart",
+            "reason": "LLM-provided",
+        }
+
+    def test_unsupported_llm_type_falls_back_to_keywords(self):
+        """Verify unsupported LLM diagram types fall back to keyword detection."""
+        detection = self._detection(
+            {"question_text": "Prove it", "diagram_needed": True, "diagram_type": "construction"}
+        )
+        assert detection["diagram_type"] == "geometric"
+        assert detection["reason"] != "LLM-provided"
+
+    def test_llm_description_classifies_diagram(self):
+        """Verify the LLM diagram description decides the type when no usable type is given."""
+        detection = self._detection(
+            {
+                "question_text": "Prove it",
+                "diagram_needed": True,
+                "diagram_description": "A pie chart of the survey results",
+            }
+        )
+        assert detection["diagram_type"] == "chart"
+        assert detection["reason"] == "Detected keyword: pie chart"
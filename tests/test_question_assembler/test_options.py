@@ -0,0 +1,26 @@
+"""Unit tests for MCQ option normalisation."""
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from question_assembler.tool import convert_options_to_dict
+
+
+class TestConvertOptionsToDict:
+    """Tests for convert_options_to_dict."""
+
+    def test_list_options(self):
+        """Verify "X) text" options are keyed by letter with the prefix stripped."""
+        options = ["A) 3", "B)  -3 ", "C) x\ny", "D) 1"]
+        assert convert_options_to_dict(options) == {"A": "3", "B": "-3", "C": "x\ny", "D": "1"}
+
+    @pytest.mark.parametrize("option", ["", None, "A)", "E) 5", "a) 5", "A. 5"])
+    def test_malformed_options_skipped(self, option):
+        """Verify options without a non-empty "A)".."D)" prefix are ignored."""
+        assert convert_options_to_dict([option]) == {}
+
+    def test_dict_options_passed_through(self):
+        """Verify dict options are returned unchanged."""
+        options = {"A": "3", "B": "-3"}
+        assert convert_options_to_dict(options) is options
@@ -0,0 +1,35 @@
+"""Unit tests for assembler question ID generation."""
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from question_assembler.tool import generate_question_id
+
+
+class TestGenerateQuestionId:
+    """Tests for generate_question_id chapter resolution."""
+
+    def test_exact_chapter(self):
+        """Verify exact chapter names use their abbreviation."""
+        assert generate_question_id("Mathematics", 10, "Real Numbers", "MCQ", 1) == (
+            "MATH-10-REA-MCQ-001"
+        )
+
+    def test_partial_chapter(self):
+        """Verify partial chapter names resolve to the first matching abbreviation."""
+        assert generate_question_id("Mathematics", 10, "Circles and Tangents", "SHORT", 12) == (
+            "MATH-10-CIR-SA-012"
+        )
+
+    def test_chapter_within_name(self):
+        """Verify a shortened chapter name resolves to the chapter containing it."""
+        assert generate_question_id("Mathematics", 10, "Linear Equations", "MCQ", 2) == (
+            "MATH-10-LIN-MCQ-002"
+        )
+
+    def test_unknown_chapter_fallback(self):
+        """Verify unknown chapters fall back to 3 letters of up to 3 words."""
+        assert generate_question_id("Mathematics", 10, "Heights and Distances", "LONG", 7) == (
+            "MATH-10-HEIANDDIS-LA-007"
+        )
@@ -1,7 +1,12 @@
 """Unit tests for blueprint JSON parsing."""
 
+import json
+import os
+
 import pytest
 
+from question_generation.orchestrator import _load_blueprint
+
 
 class TestBlueprintMetadataExtraction:
     """Tests for extracting metadata from blueprint."""
@@ -175,3 +180,45 @@ class TestTopicToChapterMapping:
                 for chapter in chapters
             )
             assert found, f"Topic '{topic}' not found in any chapter"
+
+
+class TestBlueprintLoading:
+    """Tests for loading blueprints from disk."""
+
+    def test_unchanged_file_reuses_parse(self, sample_blueprint, tmp_path):
+        """Verify an unchanged blueprint is parsed only once."""
+        path = tmp_path / "blueprint.json"
+        path.write_text(json.dumps(sample_blueprint))
+
+        assert _load_blueprint(str(path)) is _load_blueprint(str(path))
+
+    def test_modified_file_is_reloaded(self, sample_blueprint, tmp_path):
+        """Verify editing a blueprint invalidates the cached parse."""
+        path = tmp_path / "blueprint.json"
+        path.write_text(json.dumps(sample_blueprint))
+        first = _load_blueprint(str(path))
+
+        sample_blueprint["metadata"]["total_marks"] = 80
+        path.write_text(json.dumps(sample_blueprint))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        loaded = _load_blueprint(str(path))
+
+        assert loaded.blueprint["metadata"]["total_marks"] == 80
+        assert loaded.blueprint_hash != first.blueprint_hash
+        assert first.blueprint["metadata"]["total_marks"] == 50
+
+    def test_sections_typed_with_defaults(self, sample_blueprint, tmp_path):
+        """Verify sections are converted once, with defaults for missing fields."""
+        sample_blueprint["sections"].append({"section_id": "Z"})
+        path = tmp_path / "blueprint.json"
+        path.write_text(json.dumps(sample_blueprint))
+
+        sections = _load_blueprint(str(path)).sections
+        first = sample_blueprint["sections"][0]
+
+        assert sections[0].topic_focus == tuple(first["topic_focus"])
+        assert sections[0].questions_provided == first["questions_provided"]
+        assert sections[-1].question_format == "MCQ"
+        assert sections[-1].allowed_question_natures == ("NUMERICAL",)
+        assert sections[-1].topic_focus == ()
@@ -0,0 +1,39 @@
+"""Unit tests for writing generated papers to disk."""
+
+import io
+
+from question_generation.orchestrator import (
+    _PAPER_STREAM_DEPTH,
+    _dump_json,
+    _write_json_streamed,
+)
+
+
+def _streamed(value, depth=_PAPER_STREAM_DEPTH):
+    buffer = io.BytesIO()
+    _write_json_streamed(buffer, value, depth)
+    return buffer.getvalue()
+
+
+class TestStreamedPaperWrite:
+    """Tests for piecewise paper serialization."""
+
+    def test_matches_single_dump(self, sample_question_data):
+        """Verify streaming produces the same bytes as one-shot serialization."""
+        paper = {
+            "paper_id": "MATHEMATICS-10",
+            "exam_metadata": {"class": 10, "subject": "Mathematics"},
+            "sections": [
+                {"section_id": "A", "questions": [sample_question_data, {"options": {}}]},
+                {"section_id": "B", "questions": []},
+            ],
+            "total_marks": 3,
+            "notes": "Δ ABC ~ Δ PQR",
+        }
+
+        assert _streamed(paper) == _dump_json(paper)
+
+    def test_scalars_and_empty_containers(self):
+        """Verify leaves and empty containers are written unchanged."""
+        for value in ({}, [], "text", 1.5, None, [[], {}]):
+            assert _streamed(value) == _dump_json(value)
@@ -0,0 +1,155 @@
+"""Unit tests for the Qdrant-backed question bank."""
+
+import asyncio
+import json
+from dataclasses import replace
+
+import pytest
+from qdrant_client import QdrantClient
+
+from cbse_question_retriever.settings import settings
+from question_generation import question_bank as question_bank_module
+from question_generation.orchestrator import (
+    _generate_single_question,
+    generate_question_paper_tool,
+)
+from question_generation.question_bank import QuestionBank
+from question_generation.settings import QuestionBankSettings
+from question_generation.settings import settings as generation_settings
+
+
+class FakeEmbedder:
+    """Embeds every text to the same vector, so any filtered match is a perfect score."""
+
+    def _vector(self):
+        return [1.0] * settings.openai.embedding_dimensions
+
+    def generate_embedding(self, text):
+        return self._vector()
+
+    def generate_embeddings_batch(self, texts):
+        return [self._vector() for _ in texts]
+
+
+class FakeBank:
+    """Hands out copies of one banked question and records the questions added."""
+
+    def __init__(self, question=None):
+        self.question = question
+        self.taken = []
+        self.added = []
+
+    def take(self, requirements):
+        self.taken.append(requirements)
+        return None if self.question is None else dict(self.question)
+
+    def add(self, questions):
+        self.added.extend(questions)
+        return len(questions)
+
+
+@pytest.fixture
+def bank(monkeypatch):
+    """Return a question bank backed by an in-memory Qdrant instance."""
+    manager = question_bank_module.qdrant_manager
+    monkeypatch.setattr(manager, "_client", QdrantClient(":memory:"))
+    monkeypatch.setattr(question_bank_module, "embedding_generator", FakeEmbedder())
+    return QuestionBank()
+
+
+class TestQuestionBank:
+    """Tests for banking and reusing questions."""
+
+    def test_take_matching_question_once(
+        self, bank, sample_question_data, sample_requirements_easy
+    ):
+        """Verify a banked question is reused once per paper."""
+        assert bank.add([sample_question_data, dict(sample_question_data)]) == 1
+
+        assert bank.take(sample_requirements_easy) == sample_question_data
+        assert bank.take(sample_requirements_easy) is None
+
+    def test_requirements_must_match(self, bank, sample_question_data, sample_requirements_easy):
+        """Verify questions with different marks are not reused."""
+        bank.add([sample_question_data])
+
+        assert bank.take(replace(sample_requirements_easy, marks=5)) is None
+
+    def test_unavailable_bank_falls_back(self, monkeypatch, sample_requirements_easy):
+        """Verify lookup failures are treated as misses."""
+
+        def fail(*args, **kwargs):
+            raise ConnectionError("Qdrant is down")
+
+        monkeypatch.setattr(question_bank_module.qdrant_manager, "check_collection_exists", fail)
+
+        assert QuestionBank().take(sample_requirements_easy) is None
+
+
+class TestBankedGeneration:
+    """Tests for the question bank path of question generation."""
+
+    def test_bank_hit_skips_generation(self, sample_question_data, sample_requirements_easy):
+        """Verify a banked question is renumbered and queued for the cache."""
+        fake_bank = FakeBank(sample_question_data)
+        pending_writes = []
+
+        question = asyncio.run(
+            _generate_single_question(
+                sample_requirements_easy,
+                7,
+                cache_key="key",
+                bank=fake_bank,
+                pending_writes=pending_writes,
+            )
+        )
+
+        assert fake_bank.taken == [sample_requirements_easy]
+        assert question["question_id"].endswith("-007")
+        assert question["question_text"] == sample_question_data["question_text"]
+        assert [(key, json.loads(data)) for key, _, data in pending_writes] == [("key", question)]
+
+    def test_bank_miss_generates(self, sample_requirements_easy):
+        """Verify a bank miss falls back to generating the question."""
+        question = asyncio.run(
+            _generate_single_question(sample_requirements_easy, 1, bank=FakeBank())
+        )
+
+        assert question["question_id"].endswith("-001")
+        assert question["topic"] == sample_requirements_easy.topic
+
+    def test_enabled_by_setting(
+        self, monkeypatch, tmp_path, sample_question_data, valid_exam_blueprint_path
+    ):
+        """Verify the setting routes paper generation through the bank and banks the paper."""
+        fake_bank = FakeBank(sample_question_data)
+        monkeypatch.setattr(question_bank_module, "QuestionBank", lambda: fake_bank)
+        monkeypatch.setattr(
+            generation_settings, "question_bank", QuestionBankSettings(enabled=True)
+        )
+
+        result = generate_question_paper_tool.func(
+            valid_exam_blueprint_path, str(tmp_path / "paper.json"), use_cache=False
+        )
+
+        assert result["success"] is True
+        assert len(fake_bank.taken) == result["total_questions"]
+        assert len(fake_bank.added) == result["total_questions"]
+        paper = json.loads((tmp_path / "paper.json").read_text())
+        texts = {q["question_text"] for s in paper["sections"] for q in s["questions"]}
+        assert texts == {sample_question_data["question_text"]}
+
+    def test_disabled_by_default(self, monkeypatch, tmp_path, valid_exam_blueprint_path):
+        """Verify papers are generated without the bank unless it is enabled."""
+
+        def unexpected():
+            raise AssertionError("question bank opened")
+
+        monkeypatch.setattr(question_bank_module, "QuestionBank", unexpected)
+        monkeypatch.setattr(generation_settings, "question_bank", QuestionBankSettings())
+
+        result = generate_question_paper_tool.func(
+            valid_exam_blueprint_path, str(tmp_path / "paper.json"), use_cache=False
+        )
+
+        assert result["success"] is True
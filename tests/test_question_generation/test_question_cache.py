@@ -0,0 +1,260 @@
+"""Unit tests for the persistent question cache."""
+
+import asyncio
+import json
+import sqlite3
+import time
+from dataclasses import FrozenInstanceError, replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from question_generation import orchestrator
+from question_generation.cache import QuestionCache, make_cache_key
+from question_generation.orchestrator import (
+    _generate_questions,
+    _generate_single_question,
+    generate_question_paper_tool,
+)
+from question_generation.settings import QuestionCacheSettings, settings
+
+
+@pytest.fixture
+def question_cache(tmp_path):
+    """Return a question cache backed by a temporary database."""
+    cache = QuestionCache(tmp_path / "question_cache.db")
+    yield cache
+    cache.close()
+
+
+class TestQuestionCache:
+    """Tests for QuestionCache storage and lookup."""
+
+    def test_miss_returns_none(self, question_cache):
+        """Verify unknown keys are cache misses."""
+        assert question_cache.get("missing") is None
+
+    def test_set_then_get(self, question_cache, sample_question_data):
+        """Verify stored questions round-trip through the cache."""
+        question_cache.set("key", sample_question_data, "blueprint-hash")
+        assert question_cache.get("key") == sample_question_data
+
+    def test_set_many(self, question_cache, sample_question_data):
+        """Verify batched writes are stored and replace earlier entries."""
+        question_cache.set("a", {"stale": True})
+        question_cache.set_many(
+            [(key, "blueprint-hash", json.dumps(sample_question_data)) for key in ("a", "b")]
+        )
+
+        assert question_cache.get("a") == sample_question_data
+        assert question_cache.get("b") == sample_question_data
+
+    def test_clear(self, question_cache, sample_question_data):
+        """Verify clear removes every cached question."""
+        question_cache.set("key", sample_question_data)
+        question_cache.clear()
+        assert question_cache.get("key") is None
+
+    def test_connection_uses_wal(self, question_cache):
+        """Verify the shared connection runs in WAL mode."""
+        assert question_cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_close(self, tmp_path, sample_question_data):
+        """Verify close flushes hit counts and entries persist for a new instance."""
+        cache = QuestionCache(tmp_path / "question_cache.db")
+        cache.set("key", sample_question_data)
+        cache.get("key")
+        cache.close()
+
+        reopened = QuestionCache(tmp_path / "question_cache.db")
+        assert reopened.get("key") == sample_question_data
+        reopened.close()
+
+
+class TestExpiry:
+    """Tests for the cache TTL."""
+
+    def test_fresh_entry_is_a_hit(self, tmp_path, sample_question_data):
+        """Verify entries younger than the TTL are reused."""
+        cache = QuestionCache(tmp_path / "question_cache.db", ttl=timedelta(days=1))
+        cache.set("key", sample_question_data)
+        assert cache.get("key") == sample_question_data
+        cache.close()
+
+    def test_expired_entry_is_a_miss(self, tmp_path, sample_question_data):
+        """Verify remembered entries stop being served once the TTL passes."""
+        cache = QuestionCache(tmp_path / "question_cache.db", ttl=timedelta(microseconds=1))
+        cache.set("key", sample_question_data)
+        time.sleep(0.01)
+        assert cache.get("key") is None
+        cache.close()
+
+    def test_expired_rows_purged_on_open(self, tmp_path, sample_question_data):
+        """Verify rows older than the TTL are deleted when the cache is opened."""
+        db_path = tmp_path / "question_cache.db"
+        cache = QuestionCache(db_path)
+        cache.set("old", sample_question_data)
+        cache.set("new", sample_question_data)
+        old = (datetime.now() - timedelta(days=10)).isoformat()
+        cache._conn.execute(
+            "UPDATE question_cache SET created_at = ? WHERE cache_key = 'old'", (old,)
+        )
+        cache.close()
+
+        reopened = QuestionCache(db_path, ttl=timedelta(days=7))
+        assert reopened.get("old") is None
+        assert reopened.get("new") == sample_question_data
+        reopened.close()
+
+
+class TestCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_same_requirements_same_key(self, sample_requirements_easy):
+        """Verify identical requirements map to the same key."""
+        assert make_cache_key(sample_requirements_easy) == make_cache_key(sample_requirements_easy)
+
+    def test_different_requirements_different_key(
+        self, sample_requirements_easy, sample_requirements_hard
+    ):
+        """Verify different requirements map to different keys."""
+        assert make_cache_key(sample_requirements_easy) != make_cache_key(sample_requirements_hard)
+
+    def test_occurrence_distinguishes_repeats(self, sample_requirements_easy):
+        """Verify repeated requirements within a paper get distinct keys."""
+        assert make_cache_key(sample_requirements_easy, 0) != make_cache_key(
+            sample_requirements_easy, 1
+        )
+
+    def test_requirements_hashable_and_frozen(self, sample_requirements_easy):
+        """Verify requirements can key dictionaries and cannot be mutated."""
+        copy = replace(sample_requirements_easy)
+        assert {sample_requirements_easy: 1}[copy] == 1
+        with pytest.raises(FrozenInstanceError):
+            sample_requirements_easy.chapter = "Other"
+
+
+class TestCachedGeneration:
+    """Tests for cache use in _generate_single_question."""
+
+    def test_cache_hit_renumbers_question(self, question_cache, sample_requirements_easy):
+        """Verify a cached question is reused with the new question number."""
+        key = make_cache_key(sample_requirements_easy)
+        pending_writes = []
+        first = asyncio.run(
+            _generate_single_question(
+                sample_requirements_easy, 1, question_cache, key, pending_writes=pending_writes
+            )
+        )
+        assert question_cache.get(key) is None
+
+        question_cache.set_many(pending_writes)
+        second = asyncio.run(
+            _generate_single_question(sample_requirements_easy, 7, question_cache, key)
+        )
+
+        assert first["question_id"].endswith("-001")
+        assert second["question_id"].endswith("-007")
+        assert {**second, "question_id": first["question_id"]} == first
+
+    def test_batch_writes_after_generation(self, question_cache, sample_requirements_easy):
+        """Verify _generate_questions stores every new question once generation ends."""
+        jobs = [
+            (sample_requirements_easy, number, make_cache_key(sample_requirements_easy, number))
+            for number in (1, 2)
+        ]
+        questions = asyncio.run(_generate_questions(jobs, question_cache, "blueprint-hash"))
+
+        for question, (_, _, key) in zip(questions, jobs):
+            assert question_cache.get(key) == question
+
+
+class TestMemoryLayer:
+    """Tests for the in-memory LRU and buffered hit counts."""
+
+    def _used_count(self, question_cache, key):
+        with sqlite3.connect(question_cache.db_path) as conn:
+            return conn.execute(
+                "SELECT used_count FROM question_cache WHERE cache_key = ?", (key,)
+            ).fetchone()[0]
+
+    def test_hits_return_independent_copies(self, question_cache, sample_question_data):
+        """Verify callers can mutate a hit without affecting later hits."""
+        question_cache.set("key", sample_question_data)
+        question_cache.get("key")["question_id"] = "changed"
+        assert question_cache.get("key") == sample_question_data
+
+    def test_memory_hit_skips_database(self, question_cache, sample_question_data):
+        """Verify a remembered entry is served after the database row is gone."""
+        question_cache.set("key", sample_question_data)
+        with sqlite3.connect(question_cache.db_path) as conn:
+            conn.execute("DELETE FROM question_cache")
+        assert question_cache.get("key") == sample_question_data
+
+    def test_lru_evicts_oldest(self, tmp_path, sample_question_data):
+        """Verify the memory layer is bounded."""
+        cache = QuestionCache(tmp_path / "question_cache.db", memory_size=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, sample_question_data)
+        assert list(cache._memory) == ["b", "c"]
+        assert cache.get("a") == sample_question_data
+        cache.close()
+
+    def test_flush_applies_used_counts(self, question_cache, sample_question_data):
+        """Verify hit counts reach the database only on flush."""
+        question_cache.set("key", sample_question_data)
+        question_cache.get("key")
+        question_cache.get("key")
+        assert self._used_count(question_cache, "key") == 0
+
+        question_cache.flush()
+        assert self._used_count(question_cache, "key") == 2
+
+
+class TestCacheSettings:
+    """Tests for when generate_question_paper_tool uses the cache."""
+
+    @pytest.fixture
+    def opened_caches(self, monkeypatch, tmp_path):
+        """Record the caches opened while generating papers."""
+        opened = []
+
+        def get_question_cache():
+            cache = QuestionCache(tmp_path / "question_cache.db")
+            opened.append(cache)
+            return cache
+
+        monkeypatch.setattr(orchestrator, "_get_question_cache", get_question_cache)
+        yield opened
+        for cache in opened:
+            cache.close()
+
+    def _generate(self, blueprint_path, tmp_path, **kwargs):
+        result = generate_question_paper_tool.func(
+            blueprint_path, str(tmp_path / "paper.json"), **kwargs
+        )
+        assert result["success"] is True
+
+    def test_disabled_by_default(
+        self, opened_caches, monkeypatch, tmp_path, valid_exam_blueprint_path
+    ):
+        """Verify the cache is opt-in."""
+        monkeypatch.setattr(settings, "question_cache", QuestionCacheSettings())
+        self._generate(valid_exam_blueprint_path, tmp_path)
+        assert opened_caches == []
+
+    def test_enabled_by_setting(
+        self, opened_caches, monkeypatch, tmp_path, valid_exam_blueprint_path
+    ):
+        """Verify enabling the setting makes generation use the cache."""
+        monkeypatch.setattr(settings, "question_cache", QuestionCacheSettings(enabled=True))
+        self._generate(valid_exam_blueprint_path, tmp_path)
+        assert len(opened_caches) == 1
+
+    def test_use_cache_false_bypasses_cache(
+        self, opened_caches, monkeypatch, tmp_path, valid_exam_blueprint_path
+    ):
+        """Verify a single run can skip an enabled cache."""
+        monkeypatch.setattr(settings, "question_cache", QuestionCacheSettings(enabled=True))
+        self._generate(valid_exam_blueprint_path, tmp_path, use_cache=False)
+        assert opened_caches == []
@@ -1,99 +1,83 @@
 """Unit tests for question ID generation and format abbreviations."""
 
-import pytest
-from question_generation.orchestrator import (
-    _get_chapter_abbreviation,
-    _get_format_abbreviation,
-)
-
-
-class TestChapterAbbreviations:
-    """Tests for chapter abbreviation mapping."""
-
-    def test_real_numbers_abbr(self):
-        """Verify Real Numbers -> REA."""
-        assert _get_chapter_abbreviation("Real Numbers") == "REA"
-        assert _get_chapter_abbreviation("real numbers") == "REA"
-
-    def test_polynomials_abbr(self):
-        """Verify Polynomials -> POL."""
-        assert _get_chapter_abbreviation("Polynomials") == "POL"
-        assert _get_chapter_abbreviation("polynomials") == "POL"
-
-    def test_linear_equations_abbr(self):
-        """Verify Linear Equations -> LIN."""
-        assert _get_chapter_abbreviation("Linear Equations") == "LIN"
-
-    def test_quadratic_equations_abbr(self):
-        """Verify Quadratic Equations -> QUAD."""
-        assert _get_chapter_abbreviation("Quadratic Equations") == "QUAD"
-
-    def test_arithmetic_progressions_abbr(self):
-        """Verify Arithmetic Progressions -> AP."""
-        assert _get_chapter_abbreviation("Arithmetic Progressions") == "AP"
+from dataclasses import replace
 
-    def test_coordinate_geometry_abbr(self):
-        """Verify Coordinate Geometry -> COG."""
-        assert _get_chapter_abbreviation("Coordinate Geometry") == "COG"
+import pytest
 
-    def test_triangles_abbr(self):
-        """Verify Triangles -> TRI."""
-        assert _get_chapter_abbreviation("Triangles") == "TRI"
+from question_assembler.tool import generate_question_id
+from question_generation.orchestrator import _build_question_id
 
-    def test_circles_abbr(self):
-        """Verify Circles -> CIR."""
-        assert _get_chapter_abbreviation("Circles") == "CIR"
 
-    def test_mensuration_abbr(self):
-        """Verify Mensuration -> MEN."""
-        assert _get_chapter_abbreviation("Mensuration") == "MEN"
+def _id_parts(chapter: str = "Polynomials", question_format: str = "MCQ") -> list:
+    """Split a Mathematics class 10 question ID into its five parts."""
+    return generate_question_id("Mathematics", 10, chapter, question_format, 1).split("-")
 
-    def test_statistics_abbr(self):
-        """Verify Statistics -> STA."""
-        assert _get_chapter_abbreviation("Statistics") == "STA"
 
-    def test_probability_abbr(self):
-        """Verify Probability -> PRO."""
-        assert _get_chapter_abbreviation("Probability") == "PRO"
+class TestChapterAbbreviations:
+    """Tests for the chapter part of question IDs."""
 
-    def test_unknown_chapter_returns_gen(self):
-        """Verify unknown chapter returns GEN."""
-        assert _get_chapter_abbreviation("Unknown Chapter") == "GEN"
-        assert _get_chapter_abbreviation("Random Topic") == "GEN"
+    @pytest.mark.parametrize(
+        "chapter, expected",
+        [
+            ("Real Numbers", "REA"),
+            ("real numbers", "REA"),
+            ("Polynomials", "POL"),
+            ("Pair of Linear Equations in Two Variables", "LIN"),
+            ("Quadratic Equations", "QUAD"),
+            ("Arithmetic Progressions", "AP"),
+            ("Coordinate Geometry", "COG"),
+            ("Triangles", "TRI"),
+            ("Circles", "CIR"),
+            ("Mensuration", "MEN"),
+            ("Statistics", "STA"),
+            ("Probability", "PRO"),
+        ],
+    )
+    def test_known_chapter(self, chapter, expected):
+        """Verify known chapters use their abbreviation, ignoring case."""
+        assert _id_parts(chapter)[2] == expected
+
+    def test_shortened_chapter_name(self):
+        """Verify a shortened chapter name resolves to the chapter containing it."""
+        assert _id_parts("Linear Equations")[2] == "LIN"
+
+    @pytest.mark.parametrize(
+        "chapter, expected",
+        [
+            ("Number Systems", "NUMSYS"),
+            ("Unknown Chapter", "UNKCHA"),
+            ("Heights and Distances", "HEIANDDIS"),
+        ],
+    )
+    def test_unknown_chapter_fallback(self, chapter, expected):
+        """Verify unknown chapters fall back to 3 letters of up to 3 words."""
+        assert _id_parts(chapter)[2] == expected
 
 
 class TestFormatAbbreviations:
-    """Tests for question format abbreviation mapping."""
-
-    def test_mcq_abbr(self):
-        """Verify MCQ -> MCQ."""
-        assert _get_format_abbreviation("MCQ") == "MCQ"
-        assert _get_format_abbreviation("mcq") == "MCQ"
-
-    def test_very_short_abbr(self):
-        """Verify VERY_SHORT -> VSQ."""
-        assert _get_format_abbreviation("VERY_SHORT") == "VSQ"
-        assert _get_format_abbreviation("very_short") == "VSQ"
-
-    def test_short_abbr(self):
-        """Verify SHORT -> SA."""
-        assert _get_format_abbreviation("SHORT") == "SA"
-        assert _get_format_abbreviation("short") == "SA"
+    """Tests for the format part of question IDs."""
 
-    def test_long_abbr(self):
-        """Verify LONG -> LA."""
-        assert _get_format_abbreviation("LONG") == "LA"
-        assert _get_format_abbreviation("long") == "LA"
-
-    def test_case_study_abbr(self):
-        """Verify CASE_STUDY -> CS."""
-        assert _get_format_abbreviation("CASE_STUDY") == "CS"
-        assert _get_format_abbreviation("case_study") == "CS"
+    @pytest.mark.parametrize(
+        "question_format, expected",
+        [
+            ("MCQ", "MCQ"),
+            ("mcq", "MCQ"),
+            ("VERY_SHORT", "VSQ"),
+            ("SHORT", "SA"),
+            ("short", "SA"),
+            ("LONG", "LA"),
+            ("CASE_STUDY", "CS"),
+            ("case_study", "CS"),
+        ],
+    )
+    def test_known_format(self, question_format, expected):
+        """Verify known formats use their abbreviation, ignoring case."""
+        assert _id_parts(question_format=question_format)[3] == expected
 
     def test_unknown_format_returns_unk(self):
-        """Verify unknown format returns UNK."""
-        assert _get_format_abbreviation("UNKNOWN") == "UNK"
-        assert _get_format_abbreviation("random") == "UNK"
+        """Verify unknown formats return UNK."""
+        assert _id_parts(question_format="UNKNOWN")[3] == "UNK"
+        assert _id_parts(question_format="random")[3] == "UNK"
 
 
 class TestQuestionIDFormat:
@@ -101,55 +85,39 @@ class TestQuestionIDFormat:
 
     def test_id_format_structure(self):
         """Verify ID follows MATH-10-POL-MCQ-001 format."""
-        # This would be tested in integration, but we verify components here
-        chapter = _get_chapter_abbreviation("Polynomials")
-        format_abbr = _get_format_abbreviation("MCQ")
+        assert _id_parts() == ["MATH", "10", "POL", "MCQ", "001"]
 
-        question_id = f"MATH-10-{chapter}-{format_abbr}-001"
+    @pytest.mark.parametrize("number, suffix", [(1, "001"), (10, "010"), (100, "100")])
+    def test_id_number_padding(self, number, suffix):
+        """Verify question numbers are zero-padded to 3 digits."""
+        question_id = generate_question_id("Mathematics", 10, "Polynomials", "MCQ", number)
 
-        parts = question_id.split("-")
-        assert len(parts) == 5
-        assert parts[0] == "MATH"
-        assert parts[1] == "10"
-        assert parts[2] == "POL"
-        assert parts[3] == "MCQ"
-        assert parts[4] == "001"
+        assert question_id == f"MATH-10-POL-MCQ-{suffix}"
 
-    def test_id_number_padding(self):
-        """Verify question numbers are zero-padded to 3 digits."""
-        # Test various numbers
-        for num in [1, 10, 100, 999]:
-            formatted = f"{num:03d}"
-            assert len(formatted) == 3
-            assert formatted.isdigit()
-
-    def test_multiple_chapter_ids(self):
-        """Verify IDs for different chapters."""
-        chapters = [
-            ("Real Numbers", "REA"),
-            ("Polynomials", "POL"),
-            ("Triangles", "TRI"),
-        ]
+    def test_subject_prefix(self):
+        """Verify the subject prefix follows the subject."""
+        assert generate_question_id("Science", 10, "Light", "SHORT", 4) == "SCI-10-LIG-SA-004"
 
-        for chapter_name, expected_abbr in chapters:
-            chapter = _get_chapter_abbreviation(chapter_name)
-            assert chapter == expected_abbr
 
-            question_id = f"MATH-10-{chapter}-MCQ-001"
-            assert expected_abbr in question_id
+class TestBuildQuestionId:
+    """Tests for IDs built from question requirements."""
 
-    def test_multiple_format_ids(self):
-        """Verify IDs for different formats."""
-        formats = [
-            ("MCQ", "MCQ"),
-            ("SHORT", "SA"),
-            ("LONG", "LA"),
-            ("CASE_STUDY", "CS"),
-        ]
+    def test_mathematics_id(self, sample_requirements_easy):
+        """Verify a full ID for a Mathematics question."""
+        assert _build_question_id(sample_requirements_easy, 7) == "MATH-10-POL-MCQ-007"
+
+    def test_subject_prefix_follows_subject(self, sample_requirements_easy):
+        """Verify non-Mathematics papers are not labelled MATH."""
+        science = replace(sample_requirements_easy, subject="Science")
+        economics = replace(sample_requirements_easy, subject="Economics")
+
+        assert _build_question_id(science, 1).startswith("SCI-10-")
+        assert _build_question_id(economics, 1).startswith("ECON-10-")
 
-        for format_name, expected_abbr in formats:
-            fmt = _get_format_abbreviation(format_name)
-            assert fmt == expected_abbr
+    def test_matches_assembler_ids(self, sample_requirements_easy):
+        """Verify paper IDs use the question assembler's ID format."""
+        requirements = replace(sample_requirements_easy, chapter="Circles and Tangents")
 
-            question_id = f"MATH-10-POL-{fmt}-001"
-            assert expected_abbr in question_id
+        assert _build_question_id(requirements, 3) == generate_question_id(
+            "Mathematics", 10, "Circles and Tangents", "MCQ", 3
+        )
@@ -0,0 +1,34 @@
+"""Unit tests for the question generation rate limiter."""
+
+import asyncio
+import time
+
+from question_generation.orchestrator import _TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for _TokenBucket pacing."""
+
+    def test_burst_up_to_rate_is_immediate(self):
+        """Verify the first `rate` acquisitions do not wait."""
+
+        async def run():
+            bucket = _TokenBucket(5, period=60.0)
+            start = time.monotonic()
+            for _ in range(5):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 0.05
+
+    def test_waits_for_refill_past_rate(self):
+        """Verify acquisitions beyond the burst wait for tokens to refill."""
+
+        async def run():
+            bucket = _TokenBucket(2, period=0.2)
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+            return time.monotonic() - start
+
+        # Two refills at one token per 0.1s
+        assert asyncio.run(run()) >= 0.18